@@ -685,6 +685,32 @@ class MinionCodeAgent(CodeAgent):
 
         print(f"\n🔒 = readonly tool, ✏️ = read/write tool")
 
+    def _should_compact(
+        self, history: History, token_count: Optional[int] = None
+    ) -> bool:
+        """Check if compaction is needed, as BaseAgent._should_compact does.
+
+        Args:
+            history: The conversation history.
+            token_count: Token count of ``history`` if already known; it is
+                used instead of counting the whole history again.
+
+        Returns:
+            bool: True if compaction should be triggered.
+        """
+        should_compact = getattr(super(), "_should_compact", None)
+        if should_compact is None:
+            return False
+        if token_count is None:
+            return should_compact(history)
+
+        # BaseAgent keeps the threshold rules; only its token count is swapped
+        self._calculate_current_tokens = lambda _history: token_count
+        try:
+            return should_compact(history)
+        finally:
+            del self._calculate_current_tokens
+
     def get_context_stats(self) -> dict:
         """Get current context usage statistics.
 
@@ -704,7 +730,8 @@ class MinionCodeAgent(CodeAgent):
                     "remaining_tokens": context_limit,
                 }
 
-            current_tokens = self._calculate_current_tokens(self.state.history)
+            history = self.state.history
+            current_tokens = self._calculate_current_tokens(history)
             context_limit = self._get_context_window_limit()
             usage_percentage = (
                 current_tokens / context_limit if context_limit > 0 else 0.0
@@ -713,10 +740,8 @@ class MinionCodeAgent(CodeAgent):
             return {
                 "total_tokens": current_tokens,
                 "usage_percentage": usage_percentage,
-                "needs_compacting": (
-                    self._should_compact(self.state.history)
-                    if hasattr(self, "_should_compact")
-                    else False
+                "needs_compacting": self._should_compact(
+                    history, token_count=current_tokens
                 ),
                 "remaining_tokens": context_limit - current_tokens,
             }
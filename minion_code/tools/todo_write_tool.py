@@ -2,6 +2,7 @@
 
 import uuid
 import json
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from minion.tools import BaseTool
 from minion.types import AgentState
@@ -14,6 +15,10 @@ from ..utils.todo_storage import (
     set_todos,
 )
 
+_REQUIRED_FIELDS = ("id", "content", "status", "priority")
+_VALID_STATUSES = frozenset(status.value for status in TodoStatus)
+_VALID_PRIORITIES = frozenset(priority.value for priority in TodoPriority)
+
 
 class ValidationResult:
     """Result of todo validation."""
@@ -31,40 +36,40 @@ class ValidationResult:
         self.meta = meta or {}
 
 
-def validate_todos(todos: List[TodoItem]) -> ValidationResult:
-    """Validate a list of todos."""
+def validate_todos(todos: List[Dict[str, Any]]) -> ValidationResult:
+    """Validate a list of raw todo dicts that already have the required fields."""
     # Check for duplicate IDs
-    ids = [todo.id for todo in todos]
+    ids = [todo["id"] for todo in todos]
     unique_ids = set(ids)
     if len(ids) != len(unique_ids):
-        duplicate_ids = [id for id in ids if ids.count(id) > 1]
+        duplicate_ids = [id for id, count in Counter(ids).items() if count > 1]
         return ValidationResult(
             result=False,
             error_code=1,
             message="Duplicate todo IDs found",
-            meta={"duplicate_ids": list(set(duplicate_ids))},
+            meta={"duplicate_ids": duplicate_ids},
         )
 
     # Check for multiple in_progress tasks
-    in_progress_tasks = [
-        todo for todo in todos if todo.status == TodoStatus.IN_PROGRESS
+    in_progress_ids = [
+        todo["id"] for todo in todos if todo["status"] == TodoStatus.IN_PROGRESS.value
     ]
-    if len(in_progress_tasks) > 1:
+    if len(in_progress_ids) > 1:
         return ValidationResult(
             result=False,
             error_code=2,
             message="Only one task can be in_progress at a time",
-            meta={"in_progress_task_ids": [t.id for t in in_progress_tasks]},
+            meta={"in_progress_task_ids": in_progress_ids},
         )
 
     # Validate each todo
     for todo in todos:
-        if not todo.content.strip():
+        if not todo["content"].strip():
             return ValidationResult(
                 result=False,
                 error_code=3,
-                message=f'Todo with ID "{todo.id}" has empty content',
-                meta={"todo_id": todo.id},
+                message=f'Todo with ID "{todo["id"]}" has empty content',
+                meta={"todo_id": todo["id"]},
             )
 
     return ValidationResult(result=True)
@@ -175,42 +180,42 @@ class TodoWriteTool(BaseTool):
             if not isinstance(todos_data, list):
                 return "Error: todos_json must be an array of todo items"
 
-            # Convert to TodoItem objects and validate
-            todo_items = []
+            # Phase 1: validate the raw dicts before allocating any TodoItem
             for i, todo_data in enumerate(todos_data):
                 if not isinstance(todo_data, dict):
                     return f"Error: Todo item {i} must be an object"
 
                 # Validate required fields
-                required_fields = ["id", "content", "status", "priority"]
-                for field in required_fields:
+                for field in _REQUIRED_FIELDS:
                     if field not in todo_data:
                         return f"Error: Todo item {i} missing required field '{field}'"
 
                 # Validate status
-                if todo_data["status"] not in ["pending", "in_progress", "completed"]:
+                if todo_data["status"] not in _VALID_STATUSES:
                     return f"Error: Invalid status '{todo_data['status']}' in todo item {i}"
 
                 # Validate priority
-                if todo_data["priority"] not in ["high", "medium", "low"]:
+                if todo_data["priority"] not in _VALID_PRIORITIES:
                     return f"Error: Invalid priority '{todo_data['priority']}' in todo item {i}"
 
                 # Validate content
                 if not todo_data["content"].strip():
                     return f"Error: Todo item {i} has empty content"
 
-                todo_item = TodoItem(
+            validation = validate_todos(todos_data)
+            if not validation.result:
+                return f"Validation Error: {validation.message}"
+
+            # Phase 2: input is known-good, build the TodoItem objects
+            todo_items = [
+                TodoItem(
                     id=todo_data["id"],
                     content=todo_data["content"],
                     status=TodoStatus(todo_data["status"]),
                     priority=TodoPriority(todo_data["priority"]),
                 )
-                todo_items.append(todo_item)
-
-            # Validate todos
-            validation = validate_todos(todo_items)
-            if not validation.result:
-                return f"Validation Error: {validation.message}"
+                for todo_data in todos_data
+            ]
 
             # Get previous todos for comparison
             previous_todos = get_todos(agent_id)
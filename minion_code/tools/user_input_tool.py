@@ -9,6 +9,16 @@ import sys
 from minion.tools import AsyncBaseTool
 from minion.types import AgentState
 
+_STDIN_DISABLED_MESSAGE = (
+    "Interactive user_input is disabled in this UI to avoid blocking. "
+    "Ask the user directly in your assistant response and wait for their next message."
+)
+_STDIN_UNAVAILABLE_MESSAGE = (
+    "Interactive stdin is not available. "
+    "Ask the user directly in your assistant response and wait for their next message."
+)
+_DEFAULT_SUGGESTION_TEMPLATE = "{message} Default suggestion: {default}"
+
 
 class UserInputTool(AsyncBaseTool):
     """User input tool"""
@@ -88,22 +98,10 @@ class UserInputTool(AsyncBaseTool):
             }
 
             if not allow_stdin:
-                fallback = (
-                    "Interactive user_input is disabled in this UI to avoid blocking. "
-                    "Ask the user directly in your assistant response and wait for their next message."
-                )
-                if default_value:
-                    fallback += f" Default suggestion: {default_value}"
-                return fallback
+                return self._fallback_message(_STDIN_DISABLED_MESSAGE, default_value)
 
             if not sys.stdin or not sys.stdin.isatty():
-                fallback = (
-                    "Interactive stdin is not available. "
-                    "Ask the user directly in your assistant response and wait for their next message."
-                )
-                if default_value:
-                    fallback += f" Default suggestion: {default_value}"
-                return fallback
+                return self._fallback_message(_STDIN_UNAVAILABLE_MESSAGE, default_value)
 
             answers: Dict[str, Any] = {}
             for field in form_payload["fields"]:
@@ -128,6 +126,15 @@ class UserInputTool(AsyncBaseTool):
         except Exception as e:
             return f"Error getting user input: {str(e)}"
 
+    @staticmethod
+    def _fallback_message(message: str, default_value: Optional[str]) -> str:
+        """Append the default suggestion, if any, to a non-interactive fallback."""
+        if default_value:
+            return _DEFAULT_SUGGESTION_TEMPLATE.format(
+                message=message, default=default_value
+            )
+        return message
+
     def format_for_observation(self, output: Any) -> str:
         """Format tool output for LLM observation."""
         if isinstance(output, str):
@@ -7,12 +7,21 @@ config.ts file, adapted for Python and the minion-code project structure.
 import json
 import os
 import secrets
+import sys
+import time
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, TypedDict, Union
-from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict, Union
+from dataclasses import dataclass, field, asdict, is_dataclass, replace
 import logging
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 # Type definitions
@@ -63,6 +72,15 @@ ModelPointerType = Literal["main", "task", "reasoning", "quick"]
 ValidationStatus = Literal["valid", "needs_repair", "auto_repaired"]
 
 
+_GPT5_MARKER = "gpt-5"
+_VALID_REASONING_EFFORTS = frozenset(("minimal", "low", "medium", "high"))
+
+
+def _now_ms() -> int:
+    """Current wall-clock time in integer milliseconds."""
+    return time.time_ns() // 1_000_000
+
+
 @dataclass
 class ModelProfile:
     """Model profile configuration."""
@@ -74,7 +92,7 @@ class ModelProfile:
     max_tokens: int  # Output token limit
     context_length: int  # Context window size
     is_active: bool = True  # Whether profile is enabled
-    created_at: int = field(default_factory=lambda: int(os.time.time() * 1000))
+    created_at: int = field(default_factory=_now_ms)
     base_url: Optional[str] = None  # Custom endpoint
     reasoning_effort: Optional[ReasoningEffort] = None
     last_used: Optional[int] = None  # Last usage timestamp
@@ -160,6 +178,93 @@ class GlobalConfig:
     last_dismissed_update_version: Optional[str] = None
 
 
+_PROJECT_CONFIG_FIELDS = frozenset(ProjectConfig.__dataclass_fields__)
+
+
+def _copy_project_config(
+    config: Union[ProjectConfig, Dict[str, Any]],
+) -> Union[ProjectConfig, Dict[str, Any]]:
+    """Copy a project entry, duplicating only its mutable containers."""
+    if isinstance(config, dict):
+        return deepcopy(config)
+    return replace(
+        config,
+        allowed_tools=list(config.allowed_tools),
+        context=dict(config.context),
+        context_files=(
+            list(config.context_files) if config.context_files is not None else None
+        ),
+        history=list(config.history),
+        mcp_context_uris=list(config.mcp_context_uris),
+        mcp_servers=deepcopy(config.mcp_servers) if config.mcp_servers else {},
+        approved_mcprc_servers=(
+            list(config.approved_mcprc_servers)
+            if config.approved_mcprc_servers is not None
+            else None
+        ),
+        rejected_mcprc_servers=(
+            list(config.rejected_mcprc_servers)
+            if config.rejected_mcprc_servers is not None
+            else None
+        ),
+        example_files=(
+            list(config.example_files) if config.example_files is not None else None
+        ),
+    )
+
+
+def _copy_global_config(config: GlobalConfig) -> GlobalConfig:
+    """Copy a global config for a caller that may mutate it.
+
+    Cheaper than deepcopy: scalar fields are shared and only the lists,
+    dicts and nested dataclasses are duplicated.
+    """
+    responses = config.custom_api_key_responses
+    return replace(
+        config,
+        mcp_servers=deepcopy(config.mcp_servers) if config.mcp_servers else {},
+        custom_api_key_responses=(
+            {key: list(value) for key, value in responses.items()}
+            if responses is not None
+            else None
+        ),
+        # Loaded from config.json this is still a plain dict
+        oauth_account=(
+            replace(config.oauth_account)
+            if is_dataclass(config.oauth_account)
+            else deepcopy(config.oauth_account)
+        ),
+        projects=(
+            {
+                path: _copy_project_config(project_config)
+                for path, project_config in config.projects.items()
+            }
+            if config.projects is not None
+            else None
+        ),
+        model_profiles=(
+            [
+                (
+                    replace(profile)
+                    if isinstance(profile, ModelProfile)
+                    else deepcopy(profile)
+                )
+                for profile in config.model_profiles
+            ]
+            if config.model_profiles is not None
+            else None
+        ),
+        model_pointers=(
+            replace(config.model_pointers)
+            if isinstance(config.model_pointers, ModelPointers)
+            else deepcopy(config.model_pointers)
+        ),
+    )
+
+
+# Field defaults used to drop unchanged values on save; treat as read-only
+_DEFAULT_GLOBAL_CONFIG_DICT: Dict[str, Any] = asdict(GlobalConfig())
+
 # Configuration keys that can be modified
 GLOBAL_CONFIG_KEYS = [
     "auto_updater_status",
@@ -183,6 +288,32 @@ PROJECT_CONFIG_KEYS = [
 ]
 
 
+@dataclass(frozen=True)
+class _GlobalConfigIndexes:
+    """Set-based lookups derived from a loaded GlobalConfig."""
+
+    approved_api_keys: frozenset
+    rejected_api_keys: frozenset
+    trusted_project_paths: frozenset
+
+    @classmethod
+    def from_config(cls, config: GlobalConfig) -> "_GlobalConfigIndexes":
+        responses = config.custom_api_key_responses or {}
+        trusted = set()
+        for path, project_config in (config.projects or {}).items():
+            if isinstance(project_config, dict):
+                accepted = project_config.get("has_trust_dialog_accepted")
+            else:
+                accepted = project_config.has_trust_dialog_accepted
+            if accepted:
+                trusted.add(path)
+        return cls(
+            approved_api_keys=frozenset(responses.get("approved", [])),
+            rejected_api_keys=frozenset(responses.get("rejected", [])),
+            trusted_project_paths=frozenset(trusted),
+        )
+
+
 class ConfigParseError(Exception):
     """Configuration parsing error."""
 
@@ -209,15 +340,30 @@ class ConfigManager:
         self.global_config_file = self.config_dir / "config.json"
 
         # Test configurations for testing environment
+        self._is_test = False
         self._test_global_config: Optional[GlobalConfig] = None
         self._test_project_config: Optional[ProjectConfig] = None
 
+        # Parsed global config, valid while config.json keeps this
+        # (st_mtime_ns, st_size)
+        self._cached_global_config: Optional[GlobalConfig] = None
+        self._cached_stat_key: Tuple[int, int] = (-1, -1)
+        self._cached_indexes: Optional[_GlobalConfigIndexes] = None
+        self._cached_indexes_source: Optional[GlobalConfig] = None
+
     def _is_test_env(self) -> bool:
-        """Check if running in test environment."""
-        return (
-            os.getenv("PYTHON_ENV") == "test"
-            or os.getenv("PYTEST_CURRENT_TEST") is not None
-        )
+        """Check if running in test environment.
+
+        Only a positive result is cached: the module-level manager is built
+        at import, before pytest sets PYTEST_CURRENT_TEST, so a negative
+        answer is re-checked on every call.
+        """
+        if not self._is_test:
+            self._is_test = (
+                os.getenv("PYTHON_ENV") == "test"
+                or os.getenv("PYTEST_CURRENT_TEST") is not None
+            )
+        return self._is_test
 
     def _get_current_project_path(self) -> str:
         """Get current project path."""
@@ -230,9 +376,11 @@ class ConfigManager:
             config.dont_crawl_directory = True
         return config
 
-    def _safe_parse_json(self, content: str) -> Any:
+    def _safe_parse_json(self, content: Union[str, bytes]) -> Any:
         """Safely parse JSON content."""
         try:
+            if HAS_ORJSON:
+                return orjson.loads(content)
             return json.loads(content)
         except json.JSONDecodeError as e:
             logger.error(f"JSON parse error: {e}")
@@ -255,18 +403,42 @@ class ConfigManager:
         filtered_config = {}
         for key, value in config_dict.items():
             if key in default_dict:
-                if json.dumps(value, sort_keys=True) != json.dumps(
-                    default_dict[key], sort_keys=True
-                ):
+                if value != default_dict[key]:
                     filtered_config[key] = value
             else:
                 filtered_config[key] = value
 
+        is_global_config = file_path == self.global_config_file
+        if is_global_config:
+            self._cached_stat_key = (-1, -1)
+
+        if HAS_ORJSON:
+            payload = orjson.dumps(
+                filtered_config,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        else:
+            payload = json.dumps(
+                filtered_config, indent=2, ensure_ascii=False
+            ).encode("utf-8")
+        tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(filtered_config, f, indent=2, ensure_ascii=False)
+            # Write the whole payload to a sibling file and swap it in, so a
+            # crash mid-write never leaves a truncated config behind.
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+            if is_global_config and isinstance(config, GlobalConfig):
+                # Write-through so the next read does not re-parse what we wrote
+                self._cached_global_config = _copy_global_config(config)
+                stat = os.stat(file_path)
+                self._cached_stat_key = (stat.st_mtime_ns, stat.st_size)
         except (PermissionError, OSError) as e:
             logger.warning(f"Could not save config to {file_path}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
 
     def _load_config(
         self, file_path: Path, default_config: Any, throw_on_invalid: bool = False
@@ -279,7 +451,8 @@ class ConfigManager:
             return deepcopy(default_config)
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            # Both parsers accept raw UTF-8 bytes, so skip decoding to str
+            with open(file_path, "rb") as f:
                 content = f.read()
 
             parsed_config = self._safe_parse_json(content)
@@ -310,13 +483,70 @@ class ConfigManager:
             )
             return deepcopy(default_config)
 
+    def _get_cached_global_config(
+        self,
+    ) -> Tuple[Optional[GlobalConfig], Tuple[int, int]]:
+        """Return the cached global config if config.json is unchanged.
+
+        Returns:
+            The cached config (or None when stale) and the file's current
+            (st_mtime_ns, st_size).
+        """
+        try:
+            stat = os.stat(self.global_config_file)
+        except OSError:
+            return None, (-1, -1)
+
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if stat_key == self._cached_stat_key:
+            return self._cached_global_config, stat_key
+        return None, stat_key
+
+    def _get_global_config_indexes(self) -> _GlobalConfigIndexes:
+        """Get lookup indexes for the current global config.
+
+        Indexes are rebuilt only when the underlying config object changes.
+        """
+        if self._is_test_env() and self._test_global_config is not None:
+            return _GlobalConfigIndexes.from_config(self._test_global_config)
+
+        source = self._peek_global_config()
+        if self._cached_indexes is None or self._cached_indexes_source is not source:
+            self._cached_indexes = _GlobalConfigIndexes.from_config(source)
+            self._cached_indexes_source = source
+        return self._cached_indexes
+
+    def _peek_global_config(self) -> GlobalConfig:
+        """Get the current global config without copying it; do not mutate."""
+        if self._is_test_env() and self._test_global_config is not None:
+            return self._test_global_config
+
+        cached_config, _ = self._get_cached_global_config()
+        if cached_config is None:
+            self.get_global_config()
+            cached_config = self._cached_global_config
+        return cached_config
+
     def get_global_config(self) -> GlobalConfig:
         """Get global configuration."""
         if self._is_test_env() and self._test_global_config is not None:
             return self._test_global_config
 
+        cached_config, stat_key = self._get_cached_global_config()
+        if cached_config is not None:
+            return _copy_global_config(cached_config)
+
         config = self._load_config(self.global_config_file, GlobalConfig())
-        return self._migrate_model_profiles_remove_id(config)
+        config = self._migrate_model_profiles_remove_id(config)
+        if config.projects:
+            config.projects = {
+                path: self._to_project_config(project_config)
+                for path, project_config in config.projects.items()
+            }
+
+        self._cached_global_config = config
+        self._cached_stat_key = stat_key
+        return _copy_global_config(config)
 
     def save_global_config(self, config: GlobalConfig) -> None:
         """Save global configuration."""
@@ -325,10 +555,12 @@ class ConfigManager:
             return
 
         # Preserve projects when saving global config
-        current_config = self._load_config(self.global_config_file, GlobalConfig())
+        current_config, _ = self._get_cached_global_config()
+        if current_config is None:
+            current_config = self._load_config(self.global_config_file, GlobalConfig())
         config.projects = current_config.projects
 
-        self._save_config(self.global_config_file, config, GlobalConfig())
+        self._save_config(self.global_config_file, config, _DEFAULT_GLOBAL_CONFIG_DICT)
 
     def get_current_project_config(self) -> ProjectConfig:
         """Get current project configuration."""
@@ -336,41 +568,31 @@ class ConfigManager:
             return self._test_project_config
 
         project_path = self._get_current_project_path()
-        global_config = self.get_global_config()
-
-        if not global_config.projects:
-            return self._default_project_config(project_path)
+        projects = self._peek_global_config().projects
 
-        project_config_data = global_config.projects.get(project_path)
-        if project_config_data is None:
+        project_config = projects.get(project_path) if projects else None
+        if project_config is None:
             return self._default_project_config(project_path)
 
-        # Convert dict to ProjectConfig instance if needed
-        if isinstance(project_config_data, dict):
-            # Handle legacy string format for allowed_tools
-            if isinstance(project_config_data.get("allowed_tools"), str):
-                try:
-                    project_config_data["allowed_tools"] = json.loads(
-                        project_config_data["allowed_tools"]
-                    )
-                except json.JSONDecodeError:
-                    project_config_data["allowed_tools"] = []
+        # Copy just this project; loaded configs already hold ProjectConfig
+        # instances, but configs assigned in memory may still carry dicts.
+        return self._to_project_config(_copy_project_config(project_config))
 
-            # Create ProjectConfig instance from dict
-            project_config = ProjectConfig(**project_config_data)
-        else:
-            # Already a ProjectConfig instance
-            project_config = project_config_data
-            # Handle legacy string format for allowed_tools
-            if isinstance(project_config.allowed_tools, str):
-                try:
-                    project_config.allowed_tools = json.loads(
-                        project_config.allowed_tools
-                    )
-                except json.JSONDecodeError:
-                    project_config.allowed_tools = []
+    @staticmethod
+    def _to_project_config(data: Union[ProjectConfig, Dict[str, Any]]) -> ProjectConfig:
+        """Coerce a stored project entry into a ProjectConfig instance."""
+        if isinstance(data, dict):
+            data = ProjectConfig(
+                **{k: v for k, v in data.items() if k in _PROJECT_CONFIG_FIELDS}
+            )
 
-        return project_config
+        # Handle legacy string format for allowed_tools
+        if isinstance(data.allowed_tools, str):
+            try:
+                data.allowed_tools = json.loads(data.allowed_tools)
+            except json.JSONDecodeError:
+                data.allowed_tools = []
+        return data
 
     def save_current_project_config(self, project_config: ProjectConfig) -> None:
         """Save current project configuration."""
@@ -379,13 +601,18 @@ class ConfigManager:
             return
 
         project_path = self._get_current_project_path()
-        global_config = self.get_global_config()
-
-        if global_config.projects is None:
-            global_config.projects = {}
-
-        global_config.projects[project_path] = project_config
-        self._save_config(self.global_config_file, global_config, GlobalConfig())
+        global_config, _ = self._get_cached_global_config()
+        if global_config is None:
+            global_config = self.get_global_config()
+
+        # Copy-on-write: leave the cached config untouched until the save lands
+        global_config = replace(
+            global_config,
+            projects={**(global_config.projects or {}), project_path: project_config},
+        )
+        self._save_config(
+            self.global_config_file, global_config, _DEFAULT_GLOBAL_CONFIG_DICT
+        )
 
     def get_anthropic_api_key(self) -> Optional[str]:
         """Get Anthropic API key from environment."""
@@ -403,12 +630,11 @@ class ConfigManager:
         self, truncated_api_key: str
     ) -> Literal["approved", "rejected", "new"]:
         """Get custom API key status."""
-        config = self.get_global_config()
-        responses = config.custom_api_key_responses or {"approved": [], "rejected": []}
+        indexes = self._get_global_config_indexes()
 
-        if truncated_api_key in responses.get("approved", []):
+        if truncated_api_key in indexes.approved_api_keys:
             return "approved"
-        if truncated_api_key in responses.get("rejected", []):
+        if truncated_api_key in indexes.rejected_api_keys:
             return "rejected"
         return "new"
 
@@ -425,23 +651,30 @@ class ConfigManager:
 
     def check_has_trust_dialog_accepted(self) -> bool:
         """Check if trust dialog has been accepted for current or parent directories."""
-        current_path = Path(self._get_current_project_path())
-        config = self.get_global_config()
+        trusted_paths = self._get_global_config_indexes().trusted_project_paths
+        if not trusted_paths:
+            return False
 
         # Check current and parent directories
-        for path in [current_path] + list(current_path.parents):
-            path_str = str(path)
-            project_config = config.projects.get(path_str) if config.projects else None
-            if project_config and project_config.has_trust_dialog_accepted:
-                return True
-
-        return False
+        current_path = Path(self._get_current_project_path())
+        return any(
+            str(path) in trusted_paths for path in (current_path, *current_path.parents)
+        )
 
     def _migrate_model_profiles_remove_id(self, config: GlobalConfig) -> GlobalConfig:
         """Migrate model profiles to remove ID field and update pointers."""
         if not config.model_profiles:
             return config
 
+        # Already-typed profiles/pointers (e.g. a previously migrated config)
+        # carry no id field, so there is nothing to rewrite.
+        if (
+            not hasattr(config, "default_model_id")
+            and isinstance(config.model_pointers, ModelPointers)
+            and all(isinstance(p, ModelProfile) for p in config.model_profiles)
+        ):
+            return config
+
         # Build ID to model_name mapping and remove id field
         id_to_model_name = {}
         migrated_profiles = []
@@ -457,6 +690,10 @@ class ConfigManager:
 
             # Remove id field
             profile_dict.pop("id", None)
+            # Names are compared/looked up repeatedly; share one str per value
+            for key in ("model_name", "provider"):
+                if isinstance(profile_dict.get(key), str):
+                    profile_dict[key] = sys.intern(profile_dict[key])
             migrated_profiles.append(ModelProfile(**profile_dict))
 
         # Migrate model pointers
@@ -470,6 +707,8 @@ class ConfigManager:
             for pointer, value in pointers_dict.items():
                 if value:
                     model_name = id_to_model_name.get(value, value)
+                    if isinstance(model_name, str):
+                        model_name = sys.intern(model_name)
                     setattr(migrated_pointers, pointer, model_name)
 
         # Migrate legacy fields
@@ -490,71 +729,61 @@ class ConfigManager:
         """Check if a model name represents a GPT-5 model."""
         if not model_name or not isinstance(model_name, str):
             return False
-        return "gpt-5" in model_name.lower()
+        return _GPT5_MARKER in model_name.casefold()
 
     def validate_and_repair_gpt5_profile(self, profile: ModelProfile) -> ModelProfile:
         """Validate and auto-repair GPT-5 model configuration."""
         is_gpt5 = self.is_gpt5_model_name(profile.model_name)
-        now = int(os.time.time() * 1000)
+        now = _now_ms()
 
-        # Create working copy
-        repaired_profile = deepcopy(profile)
-        was_repaired = False
+        # Collect repairs first; the input profile is never mutated
+        repairs: Dict[str, Any] = {}
 
         # Set GPT-5 detection flag
         if is_gpt5 != profile.is_gpt5:
-            repaired_profile.is_gpt5 = is_gpt5
-            was_repaired = True
+            repairs["is_gpt5"] = is_gpt5
 
         if is_gpt5:
             # GPT-5 parameter validation and repair
-            valid_reasoning_efforts = ["minimal", "low", "medium", "high"]
-            if (
-                not profile.reasoning_effort
-                or profile.reasoning_effort not in valid_reasoning_efforts
-            ):
-                repaired_profile.reasoning_effort = "medium"
-                was_repaired = True
+            if profile.reasoning_effort not in _VALID_REASONING_EFFORTS:
+                repairs["reasoning_effort"] = "medium"
                 logger.info(
                     f"🔧 GPT-5 Config: Set reasoning effort to 'medium' for {profile.model_name}"
                 )
 
             # Context length validation
             if profile.context_length < 128000:
-                repaired_profile.context_length = 128000
-                was_repaired = True
+                repairs["context_length"] = 128000
                 logger.info(
                     f"🔧 GPT-5 Config: Updated context length to 128k for {profile.model_name}"
                 )
 
             # Output tokens validation
             if profile.max_tokens < 4000:
-                repaired_profile.max_tokens = 8192
-                was_repaired = True
+                repairs["max_tokens"] = 8192
                 logger.info(
                     f"🔧 GPT-5 Config: Updated max tokens to 8192 for {profile.model_name}"
                 )
 
             # Base URL validation
-            if "gpt-5" in profile.model_name and not profile.base_url:
-                repaired_profile.base_url = "https://api.openai.com/v1"
-                was_repaired = True
+            if _GPT5_MARKER in profile.model_name and not profile.base_url:
+                repairs["base_url"] = "https://api.openai.com/v1"
                 logger.info(
                     f"🔧 GPT-5 Config: Set default base URL for {profile.model_name}"
                 )
 
-        # Update validation metadata
-        repaired_profile.validation_status = (
-            "auto_repaired" if was_repaired else "valid"
-        )
-        repaired_profile.last_validation = now
-
-        if was_repaired:
+        if repairs:
             logger.info(
                 f"✅ GPT-5 Config: Auto-repaired configuration for {profile.model_name}"
             )
 
-        return repaired_profile
+        # All fields are scalars, so a shallow replace() is a full copy
+        return replace(
+            profile,
+            **repairs,
+            validation_status="auto_repaired" if repairs else "valid",
+            last_validation=now,
+        )
 
     def set_model_pointer(self, pointer: ModelPointerType, model_name: str) -> None:
         """Set a model pointer to a specific model."""
@@ -4,11 +4,74 @@ This module provides command history functionality similar to the TypeScript
 history.ts file, adapted for Python and the minion-code project structure.
 """
 
-from typing import List
-from .config import get_current_project_config, save_current_project_config
+import atexit
+import os
+import sys
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+from .config import (
+    ProjectConfig,
+    get_current_project_config,
+    save_current_project_config,
+)
 
 MAX_HISTORY_ITEMS = 100
 
+# Opt-in write-behind: coalesce add_to_history saves made within this window
+HISTORY_FLUSH_DELAY = 0.25
+
+# Commands shorter than this are interned; long pastes are left alone
+_INTERN_MAX_LENGTH = 200
+
+_pending_config: Optional[ProjectConfig] = None
+_flush_timer: Optional[threading.Timer] = None
+_pending_lock = threading.Lock()
+_atexit_registered = False
+
+# command -> command.lower(), so repeated searches don't re-lowercase history
+_lowercase_cache: Dict[str, str] = {}
+
+
+def _write_behind_enabled() -> bool:
+    """Whether history writes should be batched (MINION_HISTORY_ASYNC=1)."""
+    return os.getenv("MINION_HISTORY_ASYNC", "").lower() in {"1", "true", "yes"}
+
+
+def _load_project_config() -> ProjectConfig:
+    """Get the project config, including any history not yet flushed."""
+    with _pending_lock:
+        if _pending_config is not None:
+            return _pending_config
+    return get_current_project_config()
+
+
+def _schedule_save(project_config: ProjectConfig) -> None:
+    """Queue a project config save, flushed after HISTORY_FLUSH_DELAY."""
+    global _pending_config, _flush_timer, _atexit_registered
+    with _pending_lock:
+        _pending_config = project_config
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(HISTORY_FLUSH_DELAY, flush_history)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+        if not _atexit_registered:
+            atexit.register(flush_history)
+            _atexit_registered = True
+
+
+def flush_history() -> None:
+    """Write any pending write-behind history update to disk."""
+    global _pending_config, _flush_timer
+    with _pending_lock:
+        project_config, _pending_config = _pending_config, None
+        timer, _flush_timer = _flush_timer, None
+    if timer is not None:
+        timer.cancel()
+    if project_config is not None:
+        save_current_project_config(project_config)
+
 
 def get_history() -> List[str]:
     """Get command history for the current project.
@@ -16,7 +79,7 @@ def get_history() -> List[str]:
     Returns:
         List of command history strings, with most recent first.
     """
-    project_config = get_current_project_config()
+    project_config = _load_project_config()
     return project_config.history or []
 
 
@@ -30,27 +93,36 @@ def add_to_history(command: str) -> None:
         - Commands are added to the beginning of the history list
         - Duplicate consecutive commands are not added
         - History is limited to MAX_HISTORY_ITEMS entries
+        - With MINION_HISTORY_ASYNC=1 the save is deferred and coalesced;
+          call flush_history() to force it (also done at exit)
     """
     if not command or not command.strip():
         return
 
     command = command.strip()
-    project_config = get_current_project_config()
-    history = project_config.history or []
+    if len(command) < _INTERN_MAX_LENGTH:
+        command = sys.intern(command)
+    project_config = _load_project_config()
+    stored = project_config.history or []
 
     # Don't add if it's the same as the most recent command
-    if history and history[0] == command:
+    if stored and stored[0] == command:
         return
 
-    # Add to beginning and limit to MAX_HISTORY_ITEMS
-    history.insert(0, command)
-    project_config.history = history[:MAX_HISTORY_ITEMS]
+    # Keep the newest entries (most recent first), leaving room for command
+    history = deque(stored[: MAX_HISTORY_ITEMS - 1], maxlen=MAX_HISTORY_ITEMS)
+    history.appendleft(command)
+    project_config.history = list(history)
 
-    save_current_project_config(project_config)
+    if _write_behind_enabled():
+        _schedule_save(project_config)
+    else:
+        save_current_project_config(project_config)
 
 
 def clear_history() -> None:
     """Clear all command history for the current project."""
+    flush_history()
     project_config = get_current_project_config()
     project_config.history = []
     save_current_project_config(project_config)
@@ -69,6 +141,7 @@ def remove_from_history(command: str) -> bool:
         return False
 
     command = command.strip()
+    flush_history()
     project_config = get_current_project_config()
     history = project_config.history or []
 
@@ -111,4 +184,14 @@ def search_history(query: str) -> List[str]:
     query = query.strip().lower()
     history = get_history()
 
-    return [cmd for cmd in history if query in cmd.lower()]
+    if len(_lowercase_cache) > 2 * MAX_HISTORY_ITEMS:
+        _lowercase_cache.clear()
+
+    matches = []
+    for cmd in history:
+        lowered = _lowercase_cache.get(cmd)
+        if lowered is None:
+            lowered = _lowercase_cache[cmd] = cmd.lower()
+        if query in lowered:
+            matches.append(cmd)
+    return matches
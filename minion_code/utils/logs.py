@@ -2,8 +2,9 @@
 # -*- coding: utf-8 -*-
 
 import sys
-from datetime import datetime
+from datetime import date
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 from loguru import logger as _logger
 from minion.const import MINION_ROOT
@@ -14,43 +15,79 @@ _print_level = "INFO"
 
 ensure_minion_root_env(MINION_ROOT)
 
+_LOGS_DIR = MINION_ROOT / "logs"
+_LOGS_DIR.mkdir(parents=True, exist_ok=True)
+
+# (day, "%Y%m%d" string) so the date is only formatted again after midnight
+_date_cache: Tuple[date, str] = (date.min, "")
+
+# Sinks installed by this module and the settings they were installed with
+_handler_ids: List[int] = []
+_installed_key: Optional[Tuple[str, str, Optional[str], str]] = None
+
+
+def _formatted_date() -> str:
+    """Today's date as used in log file names, formatted once per day."""
+    global _date_cache
+    today = date.today()
+    if _date_cache[0] != today:
+        _date_cache = (today, today.strftime("%Y%m%d"))
+    return _date_cache[1]
+
+
+def _remove_handlers():
+    """Remove the sinks installed by this module (every sink on first use)."""
+    global _handler_ids, _installed_key
+    if _handler_ids:
+        for handler_id in _handler_ids:
+            try:
+                _logger.remove(handler_id)
+            except ValueError:
+                pass
+    else:
+        _logger.remove()
+    _handler_ids = []
+    _installed_key = None
+
 
 def define_log_level(print_level="INFO", logfile_level="DEBUG", name: str = None):
     """Adjust the log level to above level"""
-    global _print_level
-    _print_level = print_level
+    global _print_level, _handler_ids, _installed_key
+
+    formatted_date = _formatted_date()
+
+    # Same settings as the sinks already installed: keep the open log file
+    key = (print_level, logfile_level, name, formatted_date)
+    if key == _installed_key:
+        return _logger
 
-    current_date = datetime.now()
-    formatted_date = current_date.strftime("%Y%m%d")
+    _print_level = print_level
     log_name = (
         f"{name}_{formatted_date}" if name else formatted_date
     )  # name a log with prefix name
 
-    _logger.remove()
-    _logger.add(sys.stdout, level=print_level)
-    logs_dir = MINION_ROOT / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    _logger.add(logs_dir / f"{log_name}.txt", level=logfile_level)
+    _remove_handlers()
+    _handler_ids = [
+        _logger.add(sys.stdout, level=print_level),
+        _logger.add(_LOGS_DIR / f"{log_name}.txt", level=logfile_level),
+    ]
+    _installed_key = key
     return _logger
 
 
 def setup_tui_logging():
     """Setup logging for TUI mode - removes console output to prevent UI interference"""
-    global _print_level
+    global _print_level, _handler_ids, _installed_key
 
     # Remove all existing handlers
     _logger.remove()
+    _handler_ids = []
+    _installed_key = None
 
     # Only add file logging for TUI mode
-    current_date = datetime.now()
-    formatted_date = current_date.strftime("%Y%m%d")
-    log_name = f"{formatted_date}"
-
-    # Ensure logs directory exists
-    logs_dir = MINION_ROOT / "logs"
-    logs_dir.mkdir(exist_ok=True)
+    log_name = _formatted_date()
 
-    _logger.add(logs_dir / f"{log_name}.txt", level="DEBUG")
+    _handler_ids = [_logger.add(_LOGS_DIR / f"{log_name}.txt", level="DEBUG")]
     _print_level = "DEBUG"  # Set to DEBUG for file logging
 
     return _logger
@@ -12,28 +12,29 @@ import logging
 import os
 import asyncio
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from urllib.parse import urlparse
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 
 from minion.tools import AsyncBaseTool
 
 try:
-    from minion.tools.mcp.mcp_toolset import (
-        MCPToolset,
-        SSEServerParameters,
-        StdioServerParameters,
-        StreamableHTTPServerParameters,
-    )
+    import orjson
 
-    MCP_AVAILABLE = True
+    HAS_ORJSON = True
 except ImportError:
-    MCP_AVAILABLE = False
-    MCPToolset = None
-    SSEServerParameters = None
-    StdioServerParameters = None
-    StreamableHTTPServerParameters = None
+    HAS_ORJSON = False
+
+# The MCP framework is imported on first use (see _load_mcp_framework);
+# MCP_AVAILABLE stays None until it has been probed.
+MCP_AVAILABLE: Optional[bool] = None
+MCPToolset = None
+SSEServerParameters = None
+StdioServerParameters = None
+StreamableHTTPServerParameters = None
 
 from minion_code.utils.output_truncator import (
     MAX_TOKEN_LIMIT,
@@ -47,6 +48,80 @@ logger = logging.getLogger(__name__)
 DEFAULT_MCP_STARTUP_TIMEOUT = float(
     os.environ.get("MINION_MCP_STARTUP_TIMEOUT", "10")
 )
+DEFAULT_MCP_STARTUP_CONCURRENCY = max(
+    1, int(os.environ.get("MINION_MCP_STARTUP_CONCURRENCY", "8"))
+)
+DEFAULT_MCP_CLOSE_TIMEOUT = float(os.environ.get("MINION_MCP_CLOSE_TIMEOUT", "5"))
+
+# Parsed MCP config files keyed by (path, mtime_ns, size); treat values as read-only
+_CONFIG_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_CONFIG_CACHE_MAX_ENTRIES = 32
+
+
+def _load_mcp_framework() -> bool:
+    """Import the MCP framework on first use and report whether it is available."""
+    global MCP_AVAILABLE, MCPToolset, SSEServerParameters
+    global StdioServerParameters, StreamableHTTPServerParameters
+
+    if MCP_AVAILABLE is False:
+        return False
+
+    if None in (
+        MCPToolset,
+        SSEServerParameters,
+        StdioServerParameters,
+        StreamableHTTPServerParameters,
+    ):
+        try:
+            from minion.tools.mcp import mcp_toolset
+        except ImportError:
+            MCP_AVAILABLE = False
+            return False
+
+        MCPToolset = MCPToolset or mcp_toolset.MCPToolset
+        SSEServerParameters = SSEServerParameters or mcp_toolset.SSEServerParameters
+        StdioServerParameters = (
+            StdioServerParameters or mcp_toolset.StdioServerParameters
+        )
+        StreamableHTTPServerParameters = (
+            StreamableHTTPServerParameters
+            or mcp_toolset.StreamableHTTPServerParameters
+        )
+
+    MCP_AVAILABLE = True
+    return True
+
+
+def _parse_config_bytes(data: bytes) -> Any:
+    """Parse raw config bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _config_signature(config_path: Path) -> Tuple[str, int, int]:
+    """Return the (path, mtime_ns, size) key identifying a config file's contents."""
+    stat = config_path.stat()
+    return (str(config_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _read_config_data(
+    config_path: Path, key: Optional[Tuple[str, int, int]] = None
+) -> Dict[str, Any]:
+    """Parse an MCP config file, reusing the last parse while it is unchanged."""
+    if key is None:
+        key = _config_signature(config_path)
+
+    config_data = _CONFIG_CACHE.get(key)
+    if config_data is not None:
+        _CONFIG_CACHE.move_to_end(key)
+        return config_data
+
+    config_data = _parse_config_bytes(config_path.read_bytes())
+    _CONFIG_CACHE[key] = config_data
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX_ENTRIES:
+        _CONFIG_CACHE.popitem(last=False)
+    return config_data
 
 
 def find_mcp_config(project_dir: Optional[Path] = None) -> Optional[Path]:
@@ -73,24 +148,54 @@ def find_mcp_config(project_dir: Optional[Path] = None) -> Optional[Path]:
     Returns:
         Path to config file if found, None otherwise
     """
-    locations = get_mcp_config_locations(project_dir=project_dir)
+    project_candidates, user_candidates = _get_config_candidates(project_dir)
 
-    # Search project scope first
-    for config_path in locations["project"]:
-        if config_path.exists():
-            logger.info(f"Found MCP config at project scope: {config_path}")
+    # Search project scope first; os.path.isfile is a single stat that also
+    # skips directories that happen to share a config file's name
+    for config_path in project_candidates:
+        if os.path.isfile(config_path):
+            logger.info("Found MCP config at project scope: %s", config_path)
             return config_path
 
     # Then search user scope
-    for config_path in locations["user"]:
-        if config_path.exists():
-            logger.info(f"Found MCP config at user scope: {config_path}")
+    for config_path in user_candidates:
+        if os.path.isfile(config_path):
+            logger.info("Found MCP config at user scope: %s", config_path)
             return config_path
 
     logger.debug("No MCP config file found in any standard location")
     return None
 
 
+def find_mcp_config_and_bytes(
+    project_dir: Optional[Path] = None,
+) -> Optional[Tuple[Path, bytes]]:
+    """
+    Auto-discover an MCP config file and read it in the same pass.
+
+    Uses the same search order as find_mcp_config, but opens each candidate
+    directly so the caller does not need to stat and reopen the winner.
+
+    Returns:
+        (path, raw bytes) of the first readable config, or None
+    """
+    project_candidates, user_candidates = _get_config_candidates(project_dir)
+    for scope, candidates in (
+        ("project", project_candidates),
+        ("user", user_candidates),
+    ):
+        for config_path in candidates:
+            try:
+                data = config_path.read_bytes()
+            except OSError:
+                continue
+            logger.info("Found MCP config at %s scope: %s", scope, config_path)
+            return config_path, data
+
+    logger.debug("No MCP config file found in any standard location")
+    return None
+
+
 def get_mcp_config_locations(project_dir: Optional[Path] = None) -> Dict[str, List[Path]]:
     """
     Get all standard MCP config file locations.
@@ -98,36 +203,62 @@ def get_mcp_config_locations(project_dir: Optional[Path] = None) -> Dict[str, Li
     Returns:
         Dictionary with 'project' and 'user' scope locations
     """
-    project_root = project_dir or Path.cwd()
-    home = Path.home()
-    xdg_config_home = Path(
-        os.environ.get("XDG_CONFIG_HOME", str(Path.home() / ".config"))
+    project_candidates, user_candidates = _get_config_candidates(project_dir)
+    return {"project": list(project_candidates), "user": list(user_candidates)}
+
+
+def _get_config_candidates(
+    project_dir: Optional[Path] = None,
+) -> Tuple[Tuple[Path, ...], Tuple[Path, ...]]:
+    """Return the (project, user) candidate paths for the current environment.
+
+    Only plain strings are looked up here so a cache hit builds no Path
+    objects. Home is re-read every call because HOME may change at runtime,
+    and the cwd fallback reflects the caller's current directory.
+    """
+    project_root = str(project_dir) if project_dir else os.getcwd()
+    home = os.path.expanduser("~")
+    xdg_config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(
+        home, ".config"
     )
+    return _build_config_candidates(project_root, home, xdg_config_home)
 
-    return {
-        "project": [
-            project_root / ".mcp.json",
-            project_root / ".claude" / "mcp.json",
-            project_root / ".minion" / "mcp.json",
-        ],
-        "user": [
-            home / ".minion.json",
-            home / ".claude" / "mcp.json",
-            home / ".claude-code" / "mcp.json",
-            home / ".minion-code" / "mcp.json",
-            xdg_config_home / "minion-code" / "mcp.json",
-        ],
-    }
 
+@lru_cache(maxsize=16)
+def _build_config_candidates(
+    project_root: str, home: str, xdg_config_home: str
+) -> Tuple[Tuple[Path, ...], Tuple[Path, ...]]:
+    """Build candidate paths once per (project, home, XDG) combination.
 
-@dataclass
+    Only the paths are memoized; existence is still probed on every lookup so
+    configs created or removed mid-process are picked up.
+    """
+    project = Path(project_root)
+    home_path = Path(home)
+    return (
+        (
+            project / ".mcp.json",
+            project / ".claude" / "mcp.json",
+            project / ".minion" / "mcp.json",
+        ),
+        (
+            home_path / ".minion.json",
+            home_path / ".claude" / "mcp.json",
+            home_path / ".claude-code" / "mcp.json",
+            home_path / ".minion-code" / "mcp.json",
+            Path(xdg_config_home) / "minion-code" / "mcp.json",
+        ),
+    )
+
+
+@dataclass(slots=True)
 class MCPServerConfig:
     """Configuration for an MCP server."""
 
     name: str
     transport: str = "stdio"
     command: str = ""
-    args: List[str] = None
+    args: List[str] = field(default_factory=list)
     env: Optional[Dict[str, str]] = None
     cwd: Optional[str] = None
     url: Optional[str] = None
@@ -135,13 +266,7 @@ class MCPServerConfig:
     timeout: Optional[float] = None
     sse_read_timeout: Optional[float] = None
     disabled: bool = False
-    auto_approve: List[str] = None
-
-    def __post_init__(self):
-        if self.args is None:
-            self.args = []
-        if self.auto_approve is None:
-            self.auto_approve = []
+    auto_approve: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -241,6 +366,19 @@ def _build_large_mcp_output_message(
 class MCPToolsLoader:
     """Loader for MCP tools from configuration files."""
 
+    __slots__ = (
+        "project_dir",
+        "config_path",
+        "servers",
+        "loaded_tools",
+        "toolsets",
+        "toolsets_by_server",
+        "tools_by_server",
+        "server_statuses",
+        "_prefetched_config",
+        "_config_signature",
+    )
+
     def __init__(
         self,
         config_path: Optional[Path] = None,
@@ -257,11 +395,19 @@ class MCPToolsLoader:
                           config in standard locations (.mcp.json, .claude/, .minion/, etc.)
         """
         self.project_dir = (project_dir or Path.cwd()).resolve()
+        # Raw bytes read during discovery, consumed by the first load_config()
+        self._prefetched_config: Optional[bytes] = None
+        # Signature of the config file behind self.servers, if known
+        self._config_signature: Optional[Tuple[str, int, int]] = None
 
         if config_path:
             self.config_path = Path(config_path).expanduser().resolve()
         elif auto_discover:
-            self.config_path = find_mcp_config(project_dir=self.project_dir)
+            found = find_mcp_config_and_bytes(project_dir=self.project_dir)
+            if found is None:
+                self.config_path = None
+            else:
+                self.config_path, self._prefetched_config = found
         else:
             self.config_path = None
 
@@ -284,19 +430,43 @@ class MCPToolsLoader:
         Returns:
             Dictionary of server configurations
         """
+        prefetched, self._prefetched_config = self._prefetched_config, None
         if config_path:
             self.config_path = Path(config_path).expanduser().resolve()
+            prefetched = None
 
-        if not self.config_path or not self.config_path.exists():
-            logger.warning(f"MCP config file not found: {self.config_path}")
+        previous_signature, self._config_signature = self._config_signature, None
+
+        if not self.config_path:
+            logger.warning("MCP config file not found: %s", self.config_path)
             self.servers = {}
             self.server_statuses = {}
             return {}
 
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+            # Bytes from discovery are parsed directly; they bypass the parse
+            # cache because no stat was taken when they were read
+            if prefetched is not None:
+                signature = None
+                config_data = _parse_config_bytes(prefetched)
+            else:
+                signature = _config_signature(self.config_path)
+                if signature == previous_signature:
+                    self._config_signature = signature
+                    return self.servers
+                config_data = _read_config_data(self.config_path, signature)
+        except FileNotFoundError:
+            logger.warning("MCP config file not found: %s", self.config_path)
+            self.servers = {}
+            self.server_statuses = {}
+            return {}
+        except Exception as e:
+            logger.error("Failed to load MCP config from %s: %s", self.config_path, e)
+            self.servers = {}
+            self.server_statuses = {}
+            return {}
 
+        try:
             previous_statuses = self.server_statuses
             self.servers = {}
             servers_config = self._extract_servers_config(config_data)
@@ -317,11 +487,12 @@ class MCPToolsLoader:
                     state="disabled" if config.disabled else "pending",
                 )
 
-            logger.info(f"Loaded {len(self.servers)} MCP server configurations")
+            self._config_signature = signature
+            logger.info("Loaded %d MCP server configurations", len(self.servers))
             return self.servers
 
         except Exception as e:
-            logger.error(f"Failed to load MCP config from {self.config_path}: {e}")
+            logger.error("Failed to load MCP config from %s: %s", self.config_path, e)
             self.servers = {}
             self.server_statuses = {}
             return {}
@@ -337,12 +508,12 @@ class MCPToolsLoader:
             List of loaded tools
         """
         if server_config.disabled:
-            logger.info(f"Skipping disabled MCP server: {server_config.name}")
+            logger.info("Skipping disabled MCP server: %s", server_config.name)
             await self._close_server_toolset(server_config.name)
             self._update_server_status(server_config.name, state="disabled")
             return []
 
-        if not MCP_AVAILABLE:
+        if not _load_mcp_framework():
             logger.warning("MCP framework not available, skipping MCP server loading")
             self._update_server_status(
                 server_config.name,
@@ -354,8 +525,9 @@ class MCPToolsLoader:
         timeout_seconds = self._resolve_startup_timeout(server_config)
 
         try:
-            logger.info(f"Loading tools from MCP server: {server_config.name}")
-            logger.info(self._describe_server(server_config))
+            logger.info("Loading tools from MCP server: %s", server_config.name)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("%s", self._describe_server(server_config))
             self._update_server_status(server_config.name, state="loading")
 
             create_coro = MCPToolset.create(
@@ -384,7 +556,7 @@ class MCPToolsLoader:
             )
 
             logger.info(
-                f"Successfully loaded {len(tools)} tools from {server_config.name}"
+                "Successfully loaded %d tools from %s", len(tools), server_config.name
             )
             return tools
 
@@ -415,7 +587,7 @@ class MCPToolsLoader:
             return []
         except Exception as e:
             logger.error(
-                f"Failed to load tools from MCP server {server_config.name}: {e}"
+                "Failed to load tools from MCP server %s: %s", server_config.name, e
             )
             self._update_server_status(
                 server_config.name,
@@ -562,19 +734,23 @@ class MCPToolsLoader:
         return MCPServerConfig(
             name=server_name,
             transport=transport,
-            command=str(server_data.get("command", "")),
-            args=[str(arg) for arg in server_data.get("args", [])],
+            command=str(server_data.get("command") or ""),
+            args=[str(arg) for arg in server_data.get("args") or []],
             env={
                 str(key): str(value)
                 for key, value in (server_data.get("env") or {}).items()
             },
             cwd=server_data.get("cwd"),
             url=server_data.get("url"),
-            headers=server_data.get("headers"),
+            headers=(
+                dict(server_data["headers"])
+                if isinstance(server_data.get("headers"), dict)
+                else server_data.get("headers")
+            ),
             timeout=server_data.get("timeout"),
             sse_read_timeout=server_data.get("sse_read_timeout"),
             disabled=server_data.get("disabled", False),
-            auto_approve=server_data.get("autoApprove", []),
+            auto_approve=list(server_data.get("autoApprove") or []),
         )
 
     def _normalize_transport(self, transport: str, url: Optional[str]) -> str:
@@ -646,22 +822,43 @@ class MCPToolsLoader:
             if server_name not in self.servers:
                 raise KeyError(f"Unknown MCP server: {server_name}")
 
-        load_tasks = []
+        semaphore = asyncio.Semaphore(DEFAULT_MCP_STARTUP_CONCURRENCY)
+
+        async def _load_guarded(server_config: MCPServerConfig) -> List[Any]:
+            # Bound how many servers spawn/handshake at once; the startup
+            # timeout only starts counting once a slot is acquired.
+            async with semaphore:
+                return await self.load_tools_from_server(server_config)
+
+        load_configs = []
         for server_name in target_names:
             server_config = self.servers[server_name]
             if server_config.disabled:
                 await self._close_server_toolset(server_name)
                 continue
-            load_tasks.append(self.load_tools_from_server(server_config))
+            load_configs.append(server_config)
 
-        if load_tasks:
-            await asyncio.gather(*load_tasks)
+        if load_configs:
+            results = await asyncio.gather(
+                *(_load_guarded(config) for config in load_configs),
+                return_exceptions=True,
+            )
+            for server_config, result in zip(load_configs, results):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "Unexpected error loading MCP server %s: %s",
+                        server_config.name,
+                        result,
+                    )
+                    self._update_server_status(
+                        server_config.name, state="failed", error=str(result)
+                    )
 
         all_tools: List[Any] = []
         for server_name in self.servers:
             all_tools.extend(self.tools_by_server.get(server_name, []))
         self.loaded_tools = all_tools
-        logger.info(f"Total MCP tools loaded: {len(all_tools)}")
+        logger.info("Total MCP tools loaded: %d", len(all_tools))
         return all_tools
 
     async def reload_all_tools(self) -> List[Any]:
@@ -713,14 +910,32 @@ class MCPToolsLoader:
         """
         Close all MCP toolsets and clean up resources.
         """
-        logger.info(f"Closing {len(self.toolsets)} MCP toolsets...")
+        logger.info("Closing %d MCP toolsets...", len(self.toolsets))
 
-        for toolset in self.toolsets:
+        async def _close_one(toolset: Any) -> None:
+            # A hung server must not stall shutdown of the others
+            name = getattr(toolset, "name", "unknown")
             try:
-                await toolset.close()
-                logger.debug(f"Closed toolset: {getattr(toolset, 'name', 'unknown')}")
+                if DEFAULT_MCP_CLOSE_TIMEOUT > 0:
+                    await asyncio.wait_for(
+                        toolset.close(), timeout=DEFAULT_MCP_CLOSE_TIMEOUT
+                    )
+                else:
+                    await toolset.close()
+                logger.debug("Closed toolset: %s", name)
+            except TimeoutError:
+                logger.error(
+                    "Timed out closing toolset %s after %.1fs",
+                    name,
+                    DEFAULT_MCP_CLOSE_TIMEOUT,
+                )
             except Exception as e:
-                logger.error(f"Error closing toolset: {e}")
+                logger.error("Error closing toolset %s: %s", name, e)
+
+        await asyncio.gather(
+            *(_close_one(toolset) for toolset in self.toolsets),
+            return_exceptions=True,
+        )
 
         self.toolsets.clear()
         self.toolsets_by_server.clear()
@@ -10,6 +10,7 @@ Handles:
 - Large output saving to temp files for later retrieval
 """
 
+import os
 import time
 import uuid
 from pathlib import Path
@@ -21,6 +22,28 @@ MAX_FILE_SIZE = 1_000_000  # 1MB - 文件读取大小阈值
 MAX_TOKEN_LIMIT = 100_000  # MCP 工具 token 限制
 CACHE_DIR = Path.home() / ".minion-code" / "cache"  # 大输出缓存目录
 
+# 根据文件类型建议专用工具
+_TOOL_SUGGESTIONS = {
+    ".pdf": "pdf 工具",
+    ".xlsx": "xlsx 工具",
+    ".xls": "xlsx 工具",
+    ".docx": "docx 工具",
+    ".doc": "docx 工具",
+    ".pptx": "pptx 工具",
+}
+_DEFAULT_TOOL_SUGGESTION = "分页读取 (offset/limit 参数)"
+
+# 截断提示：如何获取完整内容
+_TOOL_HINTS = {
+    "bash": "提示: 使用 `| head -n N` 或 `| tail -n N` 限制输出行数",
+    "grep": "提示: 使用 `head_limit` 参数，或更精确的搜索模式",
+    "glob": "提示: 使用更具体的 pattern 缩小匹配范围",
+    "ls": "提示: 避免递归模式，或指定更具体的子目录",
+    "file_read": "提示: 使用 `offset` 和 `limit` 参数分页读取",
+    "python": "提示: 在代码中控制 print 输出量",
+}
+_DEFAULT_TOOL_HINT = "提示: 使用更精确的参数缩小输出范围"
+
 
 # ============ 异常类 ============
 class OutputTooLargeError(Exception):
@@ -114,32 +137,23 @@ def check_file_size_before_read(file_path: str, max_size: int = MAX_FILE_SIZE) -
     Raises:
         FileTooLargeError: 文件过大时抛出，包含建议工具
     """
-    path = Path(file_path)
-    if not path.exists():
+    try:
+        file_size = os.stat(file_path).st_size
+    except (FileNotFoundError, NotADirectoryError, ValueError):
         return
 
-    file_size = path.stat().st_size
-    if file_size > max_size:
-        size_mb = file_size / 1_000_000
-        suffix = path.suffix.lower()
-
-        # 根据文件类型建议专用工具
-        tool_suggestions = {
-            ".pdf": "pdf 工具",
-            ".xlsx": "xlsx 工具",
-            ".xls": "xlsx 工具",
-            ".docx": "docx 工具",
-            ".doc": "docx 工具",
-            ".pptx": "pptx 工具",
-        }
-        suggested = tool_suggestions.get(suffix, "分页读取 (offset/limit 参数)")
-
-        raise FileTooLargeError(
-            f"文件过大 ({size_mb:.1f}MB > {max_size/1_000_000:.1f}MB)，请使用 {suggested}",
-            file_path=str(path),
-            file_size=file_size,
-            suggested_tool=suggested,
-        )
+    # 常见情况：一次 stat + 一次整数比较
+    if file_size <= max_size:
+        return
+
+    suffix = os.path.splitext(file_path)[1].lower()
+    suggested = _TOOL_SUGGESTIONS.get(suffix, _DEFAULT_TOOL_SUGGESTION)
+    raise FileTooLargeError(
+        f"文件过大 ({file_size / 1_000_000:.1f}MB > {max_size / 1_000_000:.1f}MB)，请使用 {suggested}",
+        file_path=str(Path(file_path)),
+        file_size=file_size,
+        suggested_tool=suggested,
+    )
 
 
 # ============ 输出截断 ============
@@ -161,8 +175,16 @@ def truncate_output(
     Returns:
         截断后的输出（如果需要截断则添加提示和文件引用）
     """
-    output_bytes = output.encode("utf-8")
-    if len(output_bytes) <= max_size:
+    # UTF-8 uses at most 4 bytes per character, so short strings always fit
+    if len(output) <= max_size // 4:
+        return output
+
+    # ASCII strings (flagged by CPython, so isascii() is O(1)) have one byte per
+    # character and need no encoding at all
+    is_ascii = output.isascii()
+    output_bytes = None if is_ascii else output.encode("utf-8")
+    total_size = len(output) if is_ascii else len(output_bytes)
+    if total_size <= max_size:
         return output
 
     # Save full content to file if enabled
@@ -174,10 +196,11 @@ def truncate_output(
             pass  # Silently fail, truncation will still work
 
     # 截断到 max_size 字节，确保不截断 UTF-8 字符
-    truncated_bytes = output_bytes[:max_size]
-    truncated = truncated_bytes.decode("utf-8", errors="ignore")
+    if is_ascii:
+        truncated = output[:max_size]
+    else:
+        truncated = _utf8_prefix(output_bytes, max_size)
 
-    total_size = len(output_bytes)
     size_kb = total_size / 1024
     max_kb = max_size / 1024
 
@@ -208,8 +231,12 @@ def check_mcp_output(output: str, max_tokens: int = MAX_TOKEN_LIMIT) -> str:
     Raises:
         MCPContentTooLargeError: 输出超过 token 限制
     """
-    # 简单估算: 1 token ≈ 4 字符
-    estimated_tokens = len(output) // 4
+    # 简单估算: 1 token ≈ 4 字符; 未超出字符预算时无需估算
+    output_chars = len(output)
+    if output_chars < (max_tokens + 1) * 4:
+        return output
+
+    estimated_tokens = output_chars // 4
 
     if estimated_tokens > max_tokens:
         raise MCPContentTooLargeError(
@@ -220,14 +247,15 @@ def check_mcp_output(output: str, max_tokens: int = MAX_TOKEN_LIMIT) -> str:
     return output
 
 
+def _utf8_prefix(encoded: bytes, max_size: int) -> str:
+    """Decode the longest whole-character prefix of ``encoded`` within max_size bytes."""
+    cut = max_size
+    # Back off over continuation bytes (0b10xxxxxx) to the start of the split character
+    while 0 < cut < len(encoded) and encoded[cut] & 0xC0 == 0x80:
+        cut -= 1
+    return encoded[:cut].decode("utf-8")
+
+
 def _get_tool_hint(tool_name: str) -> str:
     """根据工具名返回获取完整内容的提示"""
-    hints = {
-        "bash": "提示: 使用 `| head -n N` 或 `| tail -n N` 限制输出行数",
-        "grep": "提示: 使用 `head_limit` 参数，或更精确的搜索模式",
-        "glob": "提示: 使用更具体的 pattern 缩小匹配范围",
-        "ls": "提示: 避免递归模式，或指定更具体的子目录",
-        "file_read": "提示: 使用 `offset` 和 `limit` 参数分页读取",
-        "python": "提示: 在代码中控制 print 输出量",
-    }
-    return hints.get(tool_name, "提示: 使用更精确的参数缩小输出范围")
+    return _TOOL_HINTS.get(tool_name, _DEFAULT_TOOL_HINT)
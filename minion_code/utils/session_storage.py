@@ -3,20 +3,182 @@
 This module provides session persistence functionality, allowing users to
 save and restore conversation sessions.
 
-Storage location: ~/.minion-code/sessions/<session_id>.json
+Storage location: ~/.minion-code/sessions/<session_id>.json, with a small
+<session_id>.meta.json sidecar holding just the metadata. Messages added
+between full saves are appended to <session_id>.messages.jsonl. Listing is served
+from an SQLite index (index.db) in the same directory, falling back to the
+sidecars when SQLite is unavailable. While the index is available the sidecar
+is only rewritten on full saves.
 """
 
+import hashlib
+import heapq
 import json
 import os
-import uuid
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, asdict, field
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from dataclasses import dataclass, field, replace
 import logging
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import simdjson
+
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Metadata-only sidecar written next to each <session_id>.json
+_META_SUFFIX = ".meta.json"
+
+# Append-only journal of messages added since the last full save
+_JOURNAL_SUFFIX = ".messages.jsonl"
+# Fold the journal back into <session_id>.json after this many appends
+_JOURNAL_COMPACT_EVERY = 100
+# Journal files kept open for appending, least recently used closed first
+_MAX_JOURNAL_HANDLES = 16
+# Legacy scans with more session files than this read them on a thread pool
+_SCAN_PARALLEL_THRESHOLD = 16
+
+# Byte budget (by on-disk size) for parsed sessions kept in memory
+_SESSION_CACHE_BYTES = int(
+    float(os.environ.get("MINION_SESSION_CACHE_MB", "100")) * 1024 * 1024
+)
+
+# SQLite index of session metadata, kept in the sessions directory
+_INDEX_FILENAME = "index.db"
+_INDEX_COLUMNS = (
+    "session_id",
+    "created_at",
+    "updated_at",
+    "project_path",
+    "message_count",
+    "title",
+)
+_INDEX_UPSERT = (
+    f"INSERT OR REPLACE INTO sessions ({', '.join(_INDEX_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_INDEX_COLUMNS))})"
+)
+_INDEX_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS sessions (
+        session_id TEXT PRIMARY KEY,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        project_path TEXT NOT NULL,
+        message_count INTEGER NOT NULL DEFAULT 0,
+        title TEXT
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS sessions_project_updated
+    ON sessions (project_path, updated_at DESC)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS sessions_updated ON sessions (updated_at DESC)
+    """,
+)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize session data as indented UTF-8 JSON, preferring orjson."""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_line(data: Any) -> bytes:
+    """Serialize one compact JSON line (with trailing newline) for the journal."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n").encode(
+        "utf-8"
+    )
+
+
+def _loads(data: bytes) -> Any:
+    """Parse session JSON bytes, preferring orjson."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# (epoch second, its local isoformat()) reused by _now_iso within that second
+_iso_second: Tuple[int, str] = (-1, "")
+
+
+def _now_iso() -> str:
+    """Return ``datetime.now().isoformat()``, formatting each second only once."""
+    global _iso_second
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached = _iso_second
+    if cached[0] != seconds:
+        cached = _iso_second = (seconds, datetime.fromtimestamp(seconds).isoformat())
+    # isoformat() leaves out a zero microsecond part, so match that
+    return f"{cached[1]}.{micros:06d}" if micros else cached[1]
+
+
+# simdjson parsers are reusable but not thread-safe, and scans run on a pool
+_simdjson_local = threading.local()
+
+
+def _loads_metadata(data: bytes) -> Dict[str, Any]:
+    """Parse only the "metadata" object out of a full session file.
+
+    With pysimdjson installed the messages and agent history are never turned
+    into Python objects; otherwise the whole document is decoded.
+    """
+    if HAS_SIMDJSON:
+        parser = getattr(_simdjson_local, "parser", None)
+        if parser is None:
+            parser = _simdjson_local.parser = simdjson.Parser()
+        return parser.parse(data).at_pointer("/metadata").as_dict()
+    return _loads(data)["metadata"]
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """Write ``payload`` to a sibling temp file and swap it into ``path``.
+
+    A crash mid-write leaves the previous file intact instead of a truncated
+    one. There is deliberately no fsync: losing the last write on power loss
+    is acceptable for session data, and skipping it keeps saves cheap.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 @dataclass
 class SessionMessage:
@@ -24,7 +186,10 @@ class SessionMessage:
 
     role: str  # 'user' or 'assistant'
     content: str
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=_now_iso)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"role": self.role, "content": self.content, "timestamp": self.timestamp}
 
 
 @dataclass
@@ -38,6 +203,38 @@ class SessionMetadata:
     message_count: int = 0
     title: Optional[str] = None  # First user message as title
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "project_path": self.project_path,
+            "message_count": self.message_count,
+            "title": self.title,
+        }
+
+
+def _ensure_title(
+    metadata: SessionMetadata, messages: Iterable[Union[SessionMessage, Dict[str, Any]]]
+) -> None:
+    """Set the title from the first user message, unless it is already set.
+
+    Once set the title never changes, so messages are only scanned while a
+    session has no title yet. Accepts SessionMessage objects or journal
+    records.
+    """
+    if metadata.title:
+        return
+    for message in messages:
+        if isinstance(message, dict):
+            role, content = message["role"], message["content"]
+        else:
+            role, content = message.role, message.content
+        if role == "user":
+            # Use first 50 chars of first user message as title
+            metadata.title = content[:50] + ("..." if len(content) > 50 else "")
+            return
+
 
 @dataclass
 class Session:
@@ -71,13 +268,198 @@ class SessionStorage:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
+        self._index_lock = threading.Lock()
+        self._index = self._open_index()
+        # Number of messages stored in each session's <session_id>.json; messages
+        # beyond that live in the journal
+        self._persisted_counts: Dict[str, int] = {}
+        # Number of messages stored in the main file and journal together
+        self._journaled_counts: Dict[str, int] = {}
+        self._journal_handles: "OrderedDict[str, BinaryIO]" = OrderedDict()
+        # session_id -> (file signature, on-disk bytes, base message count, session)
+        self._session_cache: "OrderedDict[str, Tuple[tuple, int, int, Session]]" = (
+            OrderedDict()
+        )
+        self._session_cache_bytes = 0
+        # session_id -> (digest of the last full save minus updated_at,
+        # (mtime_ns, size) of the file it produced)
+        self._saved_digests: Dict[str, Tuple[bytes, tuple]] = {}
+
+    def _open_index(self) -> Optional[sqlite3.Connection]:
+        """Open the session index, creating it and syncing it with the directory.
+
+        Returns None when SQLite cannot be used here; listing then falls back
+        to scanning the session files.
+        """
+        index_path = self.storage_dir / _INDEX_FILENAME
+        conn = None
+        try:
+            conn = sqlite3.connect(
+                str(index_path), isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in _INDEX_SCHEMA:
+                    conn.execute(statement)
+                self._reconcile_index(conn)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return conn
+        except sqlite3.Error as e:
+            logger.warning(f"Session index unavailable, scanning files instead: {e}")
+            if conn is not None:
+                conn.close()
+            return None
+
+    def _reconcile_index(self, conn: sqlite3.Connection) -> None:
+        """Bring the index in line with the session files on disk.
+
+        Files the index does not know about (saved before the index existed,
+        or copied in) are added, files rewritten since their sidecar (e.g. by
+        an older version) are re-read, and rows whose file is gone are dropped.
+        Indexed sessions with an up-to-date sidecar are not read at all.
+        """
+        session_files, by_name = self._session_entries()
+        indexed = {row[0] for row in conn.execute("SELECT session_id FROM sessions")}
+        on_disk = set()
+        stale = []
+        for entry in session_files:
+            session_id = entry.name[: -len(".json")]
+            on_disk.add(session_id)
+            try:
+                if session_id not in indexed or not self._sidecar_fresh(
+                    entry, by_name, include_journal=False
+                ):
+                    stale.append(entry)
+            except OSError:
+                stale.append(entry)
+
+        rows = [
+            self._index_row(metadata)
+            for metadata in self._read_entries(stale, by_name)
+            if metadata is not None
+        ]
+        conn.executemany(_INDEX_UPSERT, rows)
+        conn.executemany(
+            "DELETE FROM sessions WHERE session_id = ?",
+            [(session_id,) for session_id in indexed - on_disk],
+        )
+
+    @staticmethod
+    def _index_row(metadata: SessionMetadata) -> tuple:
+        """Return metadata as a row in _INDEX_COLUMNS order."""
+        return (
+            metadata.session_id,
+            metadata.created_at,
+            metadata.updated_at,
+            metadata.project_path,
+            metadata.message_count,
+            metadata.title,
+        )
+
+    def _update_index(self, metadata: SessionMetadata) -> None:
+        """Upsert one session's metadata into the index."""
+        if self._index is None:
+            return
+        try:
+            with self._index_lock:
+                self._index.execute(_INDEX_UPSERT, self._index_row(metadata))
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to index session {metadata.session_id}: {e}")
+
+    def _remove_from_index(self, session_id: str) -> None:
+        """Drop one session from the index."""
+        if self._index is None:
+            return
+        try:
+            with self._index_lock:
+                self._index.execute(
+                    "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to unindex session {session_id}: {e}")
+
+    def _get_journal_handle(self, session_id: str) -> BinaryIO:
+        """Return an open append handle for a session's journal."""
+        handle = self._journal_handles.get(session_id)
+        if handle is not None:
+            self._journal_handles.move_to_end(session_id)
+            return handle
+
+        handle = open(self._get_journal_path(session_id), "ab")
+        self._journal_handles[session_id] = handle
+        if len(self._journal_handles) > _MAX_JOURNAL_HANDLES:
+            _, oldest = self._journal_handles.popitem(last=False)
+            oldest.close()
+        return handle
+
+    def _close_journal(self, session_id: str) -> None:
+        """Close a session's journal handle, if open."""
+        handle = self._journal_handles.pop(session_id, None)
+        if handle is not None:
+            handle.close()
+
+    def close(self) -> None:
+        """Close open journal handles and the session index connection."""
+        for session_id in list(self._journal_handles):
+            self._close_journal(session_id)
+        if self._index is not None:
+            with self._index_lock:
+                self._index.close()
+            self._index = None
+
     def _get_session_path(self, session_id: str) -> Path:
         """Get the file path for a session."""
         return self.storage_dir / f"{session_id}.json"
 
+    def _get_journal_path(self, session_id: str) -> Path:
+        """Get the path of the append-only message journal for a session."""
+        return self.storage_dir / f"{session_id}{_JOURNAL_SUFFIX}"
+
+    def _get_meta_path(self, session_id: str) -> Path:
+        """Get the path of the metadata-only sidecar for a session."""
+        return self.storage_dir / f"{session_id}{_META_SUFFIX}"
+
+    def _write_metadata(self, metadata: SessionMetadata) -> None:
+        """Write the small metadata sidecar used by list_sessions."""
+        _write_atomic(
+            self._get_meta_path(metadata.session_id), _dumps(metadata.to_dict())
+        )
+
+    def _read_metadata(self, session_file: Path, sidecar_fresh: bool) -> SessionMetadata:
+        """Read a session's metadata, preferring its sidecar.
+
+        Sessions without an up-to-date sidecar (legacy files, files written by
+        older versions, or sessions journaled to since their last full save)
+        are parsed in full once and get a sidecar written.
+        """
+        session_id = session_file.name[: -len(".json")]
+        if sidecar_fresh:
+            return SessionMetadata(**_loads(self._get_meta_path(session_id).read_bytes()))
+
+        metadata = SessionMetadata(**_loads_metadata(session_file.read_bytes()))
+        for record in self._journal_records(session_id, metadata.message_count):
+            metadata.message_count += 1
+            metadata.updated_at = max(metadata.updated_at, record["timestamp"])
+            _ensure_title(metadata, (record,))
+        try:
+            self._write_metadata(metadata)
+        except OSError as e:
+            logger.debug(f"Could not write metadata sidecar for {session_id}: {e}")
+        return metadata
+
     def generate_session_id(self) -> str:
-        """Generate a new unique session ID."""
-        return str(uuid.uuid4())[:8]  # Short ID for readability
+        """Generate a new unique session ID.
+
+        IDs start with the creation time in nanoseconds (16 hex digits) followed
+        by 32 random bits, so they sort by creation time and don't collide the
+        way truncated UUIDs do. Older 8-character IDs still load and list.
+        """
+        return f"{time.time_ns():016x}{secrets.token_hex(4)}"
 
     def save_session(self, session: Session) -> None:
         """Save a session to disk.
@@ -85,33 +467,56 @@ class SessionStorage:
         Args:
             session: Session object to save
         """
-        session_path = self._get_session_path(session.metadata.session_id)
-
-        # Update the updated_at timestamp
-        session.metadata.updated_at = datetime.now().isoformat()
-        session.metadata.message_count = len(session.messages)
-
-        # Set title from first user message if not set
-        if not session.metadata.title and session.messages:
-            for msg in session.messages:
-                if msg.role == "user":
-                    # Use first 50 chars of first user message as title
-                    session.metadata.title = msg.content[:50]
-                    if len(msg.content) > 50:
-                        session.metadata.title += "..."
-                    break
+        session_id = session.metadata.session_id
+        session_path = self._get_session_path(session_id)
+        _ensure_title(session.metadata, session.messages)
 
         try:
             # Convert to dict for JSON serialization
             session_dict = {
-                "metadata": asdict(session.metadata),
-                "messages": [asdict(msg) for msg in session.messages],
+                "metadata": session.metadata.to_dict(),
+                "messages": [msg.to_dict() for msg in session.messages],
                 "agent_history": session.agent_history,  # Already list of dicts
                 "compaction_count": session.compaction_count,
             }
 
-            with open(session_path, "w", encoding="utf-8") as f:
-                json.dump(session_dict, f, indent=2, ensure_ascii=False)
+            # Skip the write when nothing but updated_at would change and the
+            # file is still the one we last wrote
+            session_dict["metadata"]["updated_at"] = None
+            session_dict["metadata"]["message_count"] = len(session.messages)
+            digest = hashlib.blake2b(
+                _dumps_line(session_dict), digest_size=16
+            ).digest()
+            saved = self._saved_digests.get(session_id)
+            if saved is not None and saved[0] == digest:
+                try:
+                    st = session_path.stat()
+                except FileNotFoundError:
+                    st = None
+                if st is not None and (st.st_mtime_ns, st.st_size) == saved[1]:
+                    logger.debug(f"Session {session_id} unchanged, not saving")
+                    return
+
+            self._touch_metadata(session)
+            session_dict["metadata"]["updated_at"] = session.metadata.updated_at
+
+            _write_atomic(session_path, _dumps(session_dict))
+            st = session_path.stat()
+            self._saved_digests[session_id] = (digest, (st.st_mtime_ns, st.st_size))
+            # Everything is in the main file now, so the journal is obsolete
+            self._close_journal(session.metadata.session_id)
+            self._get_journal_path(session.metadata.session_id).unlink(
+                missing_ok=True
+            )
+            self._persisted_counts[session.metadata.session_id] = len(
+                session.messages
+            )
+            self._journaled_counts[session.metadata.session_id] = len(
+                session.messages
+            )
+            self._evict_session(session.metadata.session_id)
+            self._write_metadata(session.metadata)
+            self._update_index(session.metadata)
 
             logger.debug(
                 f"Saved session {session.metadata.session_id} to {session_path}"
@@ -120,6 +525,153 @@ class SessionStorage:
             logger.error(f"Failed to save session {session.metadata.session_id}: {e}")
             raise
 
+    def _touch_metadata(self, session: Session) -> None:
+        """Refresh updated_at and message_count before persisting."""
+        # Update the updated_at timestamp
+        session.metadata.updated_at = _now_iso()
+        session.metadata.message_count = len(session.messages)
+
+    def _append_messages(self, session: Session) -> None:
+        """Persist a session's unsaved messages by appending them to its journal.
+
+        Every message after the last one stored is journaled, including any
+        added with ``auto_save=False`` since. Falls back to a full save when the
+        main file has not been written by this storage yet, when the session
+        holds fewer messages than are already stored, or when the journal is
+        due to be compacted.
+        """
+        session_id = session.metadata.session_id
+        count = len(session.messages)
+        persisted = self._persisted_counts.get(session_id)
+        stored = self._journaled_counts.get(session_id, persisted)
+        if (
+            persisted is None
+            or stored is None
+            or stored >= count
+            or count - 1 - persisted >= _JOURNAL_COMPACT_EVERY
+        ):
+            self.save_session(session)
+            return
+
+        self._touch_metadata(session)
+        payload = b"".join(
+            _dumps_line({"seq": seq, **session.messages[seq].to_dict()})
+            for seq in range(stored, count)
+        )
+        try:
+            # One write per append on a handle kept open across appends; the
+            # flush hands it to the OS so other readers see it immediately
+            handle = self._get_journal_handle(session_id)
+            handle.write(payload)
+            handle.flush()
+            self._journaled_counts[session_id] = count
+            if self._index is None:
+                # Listing falls back to the sidecars without the index
+                self._write_metadata(session.metadata)
+            self._update_index(session.metadata)
+        except Exception as e:
+            logger.error(f"Failed to append to session {session_id}: {e}")
+            raise
+
+    def _journal_records(
+        self, session_id: str, start: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield journal records continuing a session that has ``start`` messages.
+
+        Entries whose seq is already covered by the main file (left over from a
+        crash between a full save and the journal cleanup) are skipped, and a
+        torn final line ends the replay.
+        """
+        try:
+            raw = self._get_journal_path(session_id).read_bytes()
+        except FileNotFoundError:
+            return
+
+        expected = start
+        for line in raw.splitlines():
+            try:
+                record = _loads(line)
+            except ValueError:
+                break
+            if record.get("seq") != expected:
+                continue
+            yield record
+            expected += 1
+
+    def _read_journal(self, session_id: str, messages: List[SessionMessage]) -> bool:
+        """Append journaled messages that follow ``messages``; return True if any."""
+        applied = False
+        for record in self._journal_records(session_id, len(messages)):
+            messages.append(
+                SessionMessage(
+                    role=record["role"],
+                    content=record["content"],
+                    timestamp=record["timestamp"],
+                )
+            )
+            applied = True
+        return applied
+
+    def _session_signature(self, session_id: str) -> Tuple[tuple, int]:
+        """Return ((mtime_ns, size) of the main file and journal, total bytes).
+
+        Raises FileNotFoundError when the main session file does not exist.
+        """
+        main = self._get_session_path(session_id).stat()
+        try:
+            journal = self._get_journal_path(session_id).stat()
+        except FileNotFoundError:
+            journal_key = None
+            journal_size = 0
+        else:
+            journal_key = (journal.st_mtime_ns, journal.st_size)
+            journal_size = journal.st_size
+        return (
+            (main.st_mtime_ns, main.st_size, journal_key),
+            main.st_size + journal_size,
+        )
+
+    def _cache_session(
+        self,
+        session_id: str,
+        signature: tuple,
+        size: int,
+        base_count: int,
+        session: Session,
+    ) -> None:
+        """Remember a parsed session, evicting least recently used ones."""
+        self._evict_session(session_id)
+        if size > _SESSION_CACHE_BYTES:
+            return
+        self._session_cache[session_id] = (signature, size, base_count, session)
+        self._session_cache_bytes += size
+        while self._session_cache_bytes > _SESSION_CACHE_BYTES:
+            _, (_, evicted_size, _, _) = self._session_cache.popitem(last=False)
+            self._session_cache_bytes -= evicted_size
+
+    def _evict_session(self, session_id: str) -> None:
+        """Forget a cached session."""
+        cached = self._session_cache.pop(session_id, None)
+        if cached is not None:
+            self._session_cache_bytes -= cached[1]
+
+    @staticmethod
+    def _copy_session(session: Session) -> Session:
+        """Return a copy callers can mutate without touching the cache.
+
+        Containers are copied; SessionMessage records are shared, as they are
+        never modified after creation.
+        """
+        return Session(
+            metadata=replace(session.metadata),
+            messages=list(session.messages),
+            agent_history=[
+                dict(msg) if isinstance(msg, dict) else msg
+                for msg in session.agent_history
+            ],
+            compaction_count=session.compaction_count,
+        )
+
     def load_session(self, session_id: str) -> Optional[Session]:
         """Load a session from disk.
 
@@ -131,24 +683,41 @@ class SessionStorage:
         """
         session_path = self._get_session_path(session_id)
 
-        if not session_path.exists():
+        try:
+            signature, size = self._session_signature(session_id)
+        except FileNotFoundError:
             logger.warning(f"Session {session_id} not found at {session_path}")
             return None
 
+        cached = self._session_cache.get(session_id)
+        if cached is not None and cached[0] == signature:
+            self._session_cache.move_to_end(session_id)
+            self._persisted_counts[session_id] = cached[2]
+            self._journaled_counts[session_id] = len(cached[3].messages)
+            return self._copy_session(cached[3])
+
         try:
-            with open(session_path, "r", encoding="utf-8") as f:
-                session_dict = json.load(f)
+            session_dict = _loads(session_path.read_bytes())
 
             # Convert dict back to dataclass
             metadata = SessionMetadata(**session_dict["metadata"])
             messages = [
                 SessionMessage(**msg) for msg in session_dict.get("messages", [])
             ]
+            base_count = len(messages)
+            self._persisted_counts[session_id] = base_count
+            if self._read_journal(session_id, messages):
+                metadata.message_count = len(messages)
+                metadata.updated_at = max(
+                    metadata.updated_at, messages[-1].timestamp
+                )
+                _ensure_title(metadata, messages)
+            self._journaled_counts[session_id] = len(messages)
             # Load new fields with backward compatibility (defaults for old sessions)
             agent_history = session_dict.get("agent_history", [])
             compaction_count = session_dict.get("compaction_count", 0)
 
-            return Session(
+            session = Session(
                 metadata=metadata,
                 messages=messages,
                 agent_history=agent_history,
@@ -158,6 +727,60 @@ class SessionStorage:
             logger.error(f"Failed to load session {session_id}: {e}")
             return None
 
+        self._cache_session(session_id, signature, size, base_count, session)
+        return self._copy_session(session)
+
+    def load_agent_history(
+        self, session_id: str
+    ) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        """Load just what is needed to restore an agent's history.
+
+        Uses the cached session when it is current. Otherwise the session file
+        is parsed without building SessionMessage objects, and the journal is
+        only replayed when there is no compacted ``agent_history`` to return.
+
+        Args:
+            session_id: ID of the session to load
+
+        Returns:
+            (history, compaction_count) if found, None otherwise
+        """
+        try:
+            signature, _ = self._session_signature(session_id)
+        except FileNotFoundError:
+            logger.warning(f"Session {session_id} not found")
+            return None
+
+        cached = self._session_cache.get(session_id)
+        if cached is not None and cached[0] == signature:
+            self._session_cache.move_to_end(session_id)
+            history, compaction_count = _history_from_session(cached[3])
+            # Copy the dicts so callers can't mutate the cached session
+            return (
+                [dict(msg) if isinstance(msg, dict) else msg for msg in history],
+                compaction_count,
+            )
+
+        try:
+            session_dict = _loads(self._get_session_path(session_id).read_bytes())
+            compaction_count = session_dict.get("compaction_count", 0)
+            agent_history = session_dict.get("agent_history")
+            if agent_history:
+                return agent_history, compaction_count
+
+            messages = [
+                SessionMessage(**msg) for msg in session_dict.get("messages", [])
+            ]
+            self._read_journal(session_id, messages)
+        except Exception as e:
+            logger.error(f"Failed to load session {session_id}: {e}")
+            return None
+
+        return (
+            [{"role": msg.role, "content": msg.content} for msg in messages],
+            compaction_count,
+        )
+
     def get_latest_session_id(
         self, project_path: Optional[str] = None
     ) -> Optional[str]:
@@ -169,7 +792,7 @@ class SessionStorage:
         Returns:
             Session ID if found, None otherwise
         """
-        sessions = self.list_sessions(project_path=project_path)
+        sessions = self.list_sessions(project_path=project_path, limit=1)
         if not sessions:
             return None
 
@@ -177,44 +800,154 @@ class SessionStorage:
         return sessions[0].session_id
 
     def list_sessions(
-        self, project_path: Optional[str] = None, limit: int = 20
+        self,
+        project_path: Optional[str] = None,
+        limit: int = 20,
+        before: Optional[Tuple[str, str]] = None,
     ) -> List[SessionMetadata]:
         """List available sessions.
 
         Args:
             project_path: If provided, filter by project path
             limit: Maximum number of sessions to return
+            before: Keyset cursor ``(updated_at, session_id)`` of the last session
+                on the previous page; only older sessions are returned
 
         Returns:
             List of SessionMetadata, sorted by updated_at descending
         """
-        sessions = []
+        if self._index is not None:
+            query = f"SELECT {', '.join(_INDEX_COLUMNS)} FROM sessions"
+            conditions = []
+            params: tuple = ()
+            if project_path:
+                conditions.append("project_path = ?")
+                params += (project_path,)
+            if before is not None:
+                conditions.append("(updated_at, session_id) < (?, ?)")
+                params += tuple(before)
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += " ORDER BY updated_at DESC, session_id DESC LIMIT ?"
+            try:
+                for attempt in range(2):
+                    with self._index_lock:
+                        rows = self._index.execute(query, params + (limit,)).fetchall()
+                    # Files deleted behind our back since the index was opened
+                    missing = {
+                        row[0]
+                        for row in rows
+                        if not self._get_session_path(row[0]).exists()
+                    }
+                    if not missing or attempt:
+                        break
+                    # Drop them and query again so the page stays full
+                    for session_id in missing:
+                        self._remove_from_index(session_id)
+                return [SessionMetadata(*row) for row in rows if row[0] not in missing]
+            except sqlite3.Error as e:
+                logger.warning(f"Session index query failed, scanning files: {e}")
 
         try:
-            for session_file in self.storage_dir.glob("*.json"):
-                try:
-                    with open(session_file, "r", encoding="utf-8") as f:
-                        session_dict = json.load(f)
-
-                    metadata = SessionMetadata(**session_dict["metadata"])
-
-                    # Filter by project_path if specified
-                    if project_path and metadata.project_path != project_path:
-                        continue
-
-                    sessions.append(metadata)
-                except Exception as e:
-                    logger.warning(f"Failed to read session file {session_file}: {e}")
-                    continue
-
-            # Sort by updated_at descending (most recent first)
-            sessions.sort(key=lambda s: s.updated_at, reverse=True)
-
-            return sessions[:limit]
+            sessions = self._scan_sessions(project_path)
+            if before is not None:
+                cursor = tuple(before)
+                sessions = [
+                    s for s in sessions if (s.updated_at, s.session_id) < cursor
+                ]
+            # O(N log limit) rather than sorting every session
+            return heapq.nlargest(
+                limit, sessions, key=lambda s: (s.updated_at, s.session_id)
+            )
         except Exception as e:
             logger.error(f"Failed to list sessions: {e}")
             return []
 
+    def _session_entries(
+        self,
+    ) -> Tuple[List[os.DirEntry], Dict[str, os.DirEntry]]:
+        """Scan the storage directory once.
+
+        Returns:
+            The <session_id>.json entries, and every session-related entry
+            (including sidecars and journals) by file name.
+        """
+        try:
+            with os.scandir(self.storage_dir) as it:
+                entries = [
+                    entry
+                    for entry in it
+                    if entry.name.endswith((".json", _JOURNAL_SUFFIX))
+                ]
+        except FileNotFoundError:
+            return [], {}
+        # DirEntry caches its stat result, so each file is stat'ed at most once
+        by_name = {entry.name: entry for entry in entries}
+        session_files = [
+            entry
+            for entry in entries
+            if entry.name.endswith(".json") and not entry.name.endswith(_META_SUFFIX)
+        ]
+        return session_files, by_name
+
+    @staticmethod
+    def _sidecar_fresh(
+        entry: os.DirEntry,
+        by_name: Dict[str, os.DirEntry],
+        include_journal: bool = True,
+    ) -> bool:
+        """Return True if a session's sidecar is at least as new as its data.
+
+        The sidecar is only rewritten on full saves, so it is stale once the
+        session file, or (with ``include_journal``) its journal, is newer.
+        """
+        session_id = entry.name[: -len(".json")]
+        sidecar = by_name.get(session_id + _META_SUFFIX)
+        if sidecar is None:
+            return False
+        newest = entry.stat().st_mtime_ns
+        journal = by_name.get(session_id + _JOURNAL_SUFFIX)
+        if include_journal and journal is not None:
+            newest = max(newest, journal.stat().st_mtime_ns)
+        return sidecar.stat().st_mtime_ns >= newest
+
+    def _read_entries(
+        self, session_files: List[os.DirEntry], by_name: Dict[str, os.DirEntry]
+    ) -> List[Optional[SessionMetadata]]:
+        """Read metadata for the given session files (None where unreadable)."""
+
+        def scan_one(entry: os.DirEntry) -> Optional[SessionMetadata]:
+            session_file = Path(entry.path)
+            try:
+                if not entry.is_file():
+                    return None
+                return self._read_metadata(
+                    session_file, self._sidecar_fresh(entry, by_name)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to read session file {session_file}: {e}")
+                return None
+
+        # Reads are I/O-bound, so overlap them once there are enough to matter
+        if len(session_files) > _SCAN_PARALLEL_THRESHOLD:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(scan_one, session_files))
+        return [scan_one(f) for f in session_files]
+
+    def _scan_sessions(self, project_path: Optional[str]) -> List[SessionMetadata]:
+        """Read metadata for every session file, in no particular order."""
+        session_files, by_name = self._session_entries()
+        results = self._read_entries(session_files, by_name)
+
+        # Filter by project_path if specified
+        return [
+            metadata
+            for metadata in results
+            if metadata is not None
+            and (not project_path or metadata.project_path == project_path)
+        ]
+
     def delete_session(self, session_id: str) -> bool:
         """Delete a session.
 
@@ -231,6 +964,14 @@ class SessionStorage:
 
         try:
             session_path.unlink()
+            self._close_journal(session_id)
+            self._get_meta_path(session_id).unlink(missing_ok=True)
+            self._get_journal_path(session_id).unlink(missing_ok=True)
+            self._persisted_counts.pop(session_id, None)
+            self._journaled_counts.pop(session_id, None)
+            self._saved_digests.pop(session_id, None)
+            self._evict_session(session_id)
+            self._remove_from_index(session_id)
             logger.info(f"Deleted session {session_id}")
             return True
         except Exception as e:
@@ -246,7 +987,7 @@ class SessionStorage:
         Returns:
             New Session object
         """
-        now = datetime.now().isoformat()
+        now = _now_iso()
         session_id = self.generate_session_id()
 
         if project_path is None:
@@ -276,50 +1017,92 @@ class SessionStorage:
         message = SessionMessage(role=role, content=content)
         session.messages.append(message)
 
+        if role == "user":
+            _ensure_title(session.metadata, session.messages)
+
         if auto_save:
-            self.save_session(session)
+            self._append_messages(session)
+
+
+# Global instance, created on first use so importing this module has no
+# filesystem side effects
+_storage: Optional[SessionStorage] = None
+
+
+def _get_storage() -> SessionStorage:
+    global _storage
+    if _storage is None:
+        _storage = SessionStorage()
+    return _storage
 
 
-# Global instance
-session_storage = SessionStorage()
+def __getattr__(name: str) -> Any:
+    # Keep the old module-level ``session_storage`` name working
+    if name == "session_storage":
+        return _get_storage()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Convenience functions
 def create_session(project_path: Optional[str] = None) -> Session:
     """Create a new session."""
-    return session_storage.create_session(project_path)
+    return _get_storage().create_session(project_path)
 
 
 def save_session(session: Session) -> None:
     """Save a session."""
-    session_storage.save_session(session)
+    _get_storage().save_session(session)
 
 
 def load_session(session_id: str) -> Optional[Session]:
     """Load a session by ID."""
-    return session_storage.load_session(session_id)
+    return _get_storage().load_session(session_id)
 
 
 def get_latest_session_id(project_path: Optional[str] = None) -> Optional[str]:
     """Get the most recent session ID."""
-    return session_storage.get_latest_session_id(project_path)
+    return _get_storage().get_latest_session_id(project_path)
 
 
 def list_sessions(
-    project_path: Optional[str] = None, limit: int = 20
+    project_path: Optional[str] = None,
+    limit: int = 20,
+    before: Optional[Tuple[str, str]] = None,
 ) -> List[SessionMetadata]:
     """List available sessions."""
-    return session_storage.list_sessions(project_path, limit)
+    return _get_storage().list_sessions(project_path, limit, before)
 
 
 def add_message(
     session: Session, role: str, content: str, auto_save: bool = True
 ) -> None:
     """Add a message to a session."""
-    session_storage.add_message(session, role, content, auto_save)
+    _get_storage().add_message(session, role, content, auto_save)
 
 
-def restore_agent_history(agent, session: Session, verbose: bool = False) -> int:
+def load_agent_history(
+    session_id: str,
+) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+    """Load a session's agent history and compaction count by ID."""
+    return _get_storage().load_agent_history(session_id)
+
+
+def _history_from_session(session: Session) -> Tuple[List[Dict[str, Any]], int]:
+    """Return (history, compaction_count) to restore from a loaded session."""
+    # Prefer agent_history (compacted) if available
+    if session.agent_history:
+        return list(session.agent_history), session.compaction_count
+
+    # Fallback to original messages (first time or old sessions without agent_history)
+    return (
+        [{"role": msg.role, "content": msg.content} for msg in session.messages],
+        session.compaction_count,
+    )
+
+
+def restore_agent_history(
+    agent, session: Union[Session, str], verbose: bool = False
+) -> int:
     """Restore agent's conversation history from session.
 
     Prefers `agent_history` (compacted) over `messages` (original) to avoid
@@ -327,7 +1110,8 @@ def restore_agent_history(agent, session: Session, verbose: bool = False) -> int
 
     Args:
         agent: The agent instance with state.history
-        session: Session to restore from
+        session: Session to restore from, or a session ID to load only the
+            history for (see SessionStorage.load_agent_history)
         verbose: Print debug info
 
     Returns:
@@ -340,30 +1124,31 @@ def restore_agent_history(agent, session: Session, verbose: bool = False) -> int
     if not hasattr(agent, "state") or not hasattr(agent.state, "history"):
         return 0
 
+    if isinstance(session, str):
+        loaded = load_agent_history(session)
+        if loaded is None:
+            return 0
+        history, compaction_count = loaded
+        compacted = compaction_count > 0
+    else:
+        history, compaction_count = _history_from_session(session)
+        compacted = bool(session.agent_history)
+
     # Clear existing history first
     agent.state.history.clear()
-
-    # Prefer agent_history (compacted) if available
-    if session.agent_history:
-        for msg in session.agent_history:
-            agent.state.history.append(msg)
-
-        if verbose:
-            print(
-                f"Restored {len(session.agent_history)} messages from agent_history "
-                f"(compacted {session.compaction_count} times)"
-            )
-
-        return len(session.agent_history)
-
-    # Fallback to original messages (first time or old sessions without agent_history)
-    if not session.messages:
+    if not history:
         return 0
 
-    for msg in session.messages:
-        agent.state.history.append({"role": msg.role, "content": msg.content})
+    for msg in history:
+        agent.state.history.append(msg)
 
     if verbose:
-        print(f"Restored {len(session.messages)} messages from original history")
+        if compacted:
+            print(
+                f"Restored {len(history)} messages from agent_history "
+                f"(compacted {compaction_count} times)"
+            )
+        else:
+            print(f"Restored {len(history)} messages from original history")
 
-    return len(session.messages)
+    return len(history)
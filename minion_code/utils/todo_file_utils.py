@@ -1,11 +1,15 @@
 """Utilities for todo file path management."""
 
 import os
+import re
 from pathlib import Path
 from typing import Optional
 
 from ..runtime_paths import DEFAULT_MINION_ROOT
 
+# Matches "todos_{agent_id}.json"; the agent group is "default" for the default file
+_TODO_FILE_RE = re.compile(r"todos_(?P<agent>.*)\.json", re.DOTALL)
+
 
 def get_todo_file_path(
     agent_id: Optional[str] = None, storage_dir: Optional[str] = None
@@ -71,16 +75,14 @@ def list_todo_files(storage_dir: Optional[str] = None) -> list[str]:
     if storage_dir is None:
         storage_dir = get_default_storage_dir()
 
-    if not os.path.exists(storage_dir):
+    try:
+        with os.scandir(storage_dir) as it:
+            return [
+                entry.path for entry in it if _TODO_FILE_RE.fullmatch(entry.name)
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    todo_files = []
-    for filename in os.listdir(storage_dir):
-        if filename.startswith("todos_") and filename.endswith(".json"):
-            todo_files.append(os.path.join(storage_dir, filename))
-
-    return todo_files
-
 
 def extract_agent_id_from_todo_file(file_path: str) -> Optional[str]:
     """
@@ -92,17 +94,12 @@ def extract_agent_id_from_todo_file(file_path: str) -> Optional[str]:
     Returns:
         Agent ID if found, None if it's the default file.
     """
-    filename = os.path.basename(file_path)
-
-    if filename == "todos_default.json":
+    match = _TODO_FILE_RE.fullmatch(os.path.basename(file_path))
+    if match is None:
         return None
 
-    if filename.startswith("todos_") and filename.endswith(".json"):
-        # Extract agent_id from "todos_{agent_id}.json"
-        agent_id = filename[6:-5]  # Remove "todos_" prefix and ".json" suffix
-        return agent_id if agent_id else None
-
-    return None
+    agent_id = match.group("agent")
+    return agent_id if agent_id and agent_id != "default" else None
 
 
 def is_todo_file(file_path: str) -> bool:
@@ -115,7 +112,4 @@ def is_todo_file(file_path: str) -> bool:
     Returns:
         True if it's a todo file, False otherwise.
     """
-    filename = os.path.basename(file_path)
-    return (
-        filename.startswith("todos_") and filename.endswith(".json")
-    ) or filename == "todos_default.json"
+    return _TODO_FILE_RE.fullmatch(os.path.basename(file_path)) is not None
@@ -2,14 +2,31 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import logging
 import os
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+import threading
+import weakref
+from typing import List, Dict, Any, Optional, Set, Tuple
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 
 from .todo_file_utils import get_todo_file_path, get_default_storage_dir
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait after a change before writing, so bursts of updates are
+# coalesced into one write; 0 writes every change straight away
+DEFAULT_TODO_FLUSH_DELAY = float(os.environ.get("MINION_TODO_FLUSH_DELAY", "0.05"))
+
 
 class TodoStatus(Enum):
     PENDING = "pending"
@@ -49,82 +66,257 @@ class TodoItem:
 
 
 class TodoStorage:
-    def __init__(self, storage_dir: Optional[str] = None):
+    def __init__(
+        self,
+        storage_dir: Optional[str] = None,
+        flush_delay: float = DEFAULT_TODO_FLUSH_DELAY,
+    ):
         if storage_dir is None:
             storage_dir = get_default_storage_dir()
         self.storage_dir = storage_dir
+        self.flush_delay = flush_delay
         os.makedirs(storage_dir, exist_ok=True)
+        # Guards the cache against the flush timer's thread
+        self._lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
+        # Error from a scheduled flush, raised by the next call
+        self._write_error: Optional[BaseException] = None
+        # agent_id -> ((mtime_ns, size) of the file when cached, todos)
+        self._cache: Dict[Optional[str], Tuple[Optional[tuple], List[TodoItem]]] = {}
+        # agent_id -> {todo_id: todo} over the same objects as the cached list
+        self._by_id: Dict[Optional[str], Dict[str, TodoItem]] = {}
+        # agent_ids whose cached todos have not been written yet
+        self._dirty: Set[Optional[str]] = set()
+        _live_storages.add(self)
 
     def _get_file_path(self, agent_id: Optional[str] = None) -> str:
         return get_todo_file_path(agent_id, self.storage_dir)
 
-    def get_todos(self, agent_id: Optional[str] = None) -> List[TodoItem]:
-        """Get all todos for a specific agent or default."""
-        file_path = self._get_file_path(agent_id)
-
-        if not os.path.exists(file_path):
-            return []
-
+    def _file_signature(self, agent_id: Optional[str]) -> Optional[tuple]:
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return [TodoItem.from_dict(item) for item in data]
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return []
+            st = os.stat(self._get_file_path(agent_id))
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _set_cached(
+        self, agent_id: Optional[str], signature: Optional[tuple], todos: List[TodoItem]
+    ) -> None:
+        self._cache[agent_id] = (signature, todos)
+        # Reversed so that, as with a linear scan, the first duplicate id wins
+        self._by_id[agent_id] = {todo.id: todo for todo in reversed(todos)}
+
+    def _load(self, agent_id: Optional[str]) -> List[TodoItem]:
+        """Return the cached todo list for ``agent_id``, re-reading if stale."""
+        if agent_id in self._dirty:
+            return self._cache[agent_id][1]
+
+        signature = self._file_signature(agent_id)
+        cached = self._cache.get(agent_id)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        todos: List[TodoItem] = []
+        if signature is not None:
+            try:
+                with open(self._get_file_path(agent_id), "rb") as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+                todos = [TodoItem.from_dict(item) for item in data]
+            except (json.JSONDecodeError, KeyError, ValueError):
+                todos = []
+
+        self._set_cached(agent_id, signature, todos)
+        return todos
+
+    def _write(self, agent_id: Optional[str], todos: List[TodoItem]) -> None:
+        data = [todo.to_dict() for todo in todos]
+        if HAS_ORJSON:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
-    def set_todos(self, todos: List[TodoItem], agent_id: Optional[str] = None) -> None:
-        """Set todos for a specific agent or default."""
+        # Swap in a fully written sibling file so a crash mid-write never
+        # leaves a truncated todo list behind (no fsync, as for sessions)
         file_path = self._get_file_path(agent_id)
+        tmp_path = file_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._cache[agent_id] = (self._file_signature(agent_id), todos)
+        self._dirty.discard(agent_id)
+
+    def flush(self, agent_id: Optional[str] = None) -> None:
+        """Write pending changes for ``agent_id``, or for every agent if None.
+
+        A change that fails to write is discarded, so later reads come from
+        disk rather than returning todos that were never saved, and the error
+        is raised.
+        """
+        with self._lock:
+            agent_ids = list(self._dirty) if agent_id is None else [agent_id]
+            error: Optional[Exception] = None
+            for dirty_id in agent_ids:
+                if dirty_id not in self._dirty:
+                    continue
+                try:
+                    self._write(dirty_id, self._cache[dirty_id][1])
+                except Exception as e:
+                    self._dirty.discard(dirty_id)
+                    self._cache.pop(dirty_id, None)
+                    self._by_id.pop(dirty_id, None)
+                    if error is None:
+                        error = e
+            if error is not None:
+                raise error
+
+    def _raise_write_error(self) -> None:
+        """Raise, once, the error from a failed scheduled flush."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def _mark_dirty(
+        self, agent_id: Optional[str], todos: Optional[List[TodoItem]] = None
+    ) -> None:
+        """Mark ``agent_id`` as changed, replacing its list if ``todos`` is given."""
+        if todos is not None:
+            signature = self._cache[agent_id][0] if agent_id in self._cache else None
+            self._set_cached(agent_id, signature, todos)
+        self._dirty.add(agent_id)
+        if self.flush_delay <= 0:
+            self.flush(agent_id)
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_delay, self._flush_pending)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_pending(self) -> None:
+        """Timer callback: write pending changes.
+
+        Nothing on the timer thread could handle a write error, so it is
+        logged here and raised by the next call on this storage instead.
+        """
+        with self._lock:
+            self._flush_timer = None
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Failed to write todos: {e}")
+                self._write_error = e
+
+    def flush_sync(self) -> None:
+        """Write every pending change now, cancelling any scheduled flush."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self.flush()
 
-        data = [todo.to_dict() for todo in todos]
+    def get_todos(self, agent_id: Optional[str] = None) -> List[TodoItem]:
+        """Get all todos for a specific agent or default."""
+        with self._lock:
+            self._raise_write_error()
+            return [replace(todo) for todo in self._load(agent_id)]
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def set_todos(self, todos: List[TodoItem], agent_id: Optional[str] = None) -> None:
+        """Set todos for a specific agent or default."""
+        with self._lock:
+            self._raise_write_error()
+            self._mark_dirty(agent_id, [replace(todo) for todo in todos])
 
     def add_todo(self, todo: TodoItem, agent_id: Optional[str] = None) -> None:
         """Add a new todo."""
-        todos = self.get_todos(agent_id)
-        todos.append(todo)
-        self.set_todos(todos, agent_id)
+        with self._lock:
+            self._raise_write_error()
+            todos = self._load(agent_id)
+            todo = replace(todo)
+            todos.append(todo)
+            self._by_id[agent_id].setdefault(todo.id, todo)
+            self._mark_dirty(agent_id)
+
+    @staticmethod
+    def _apply_updates(todo: TodoItem, updates: Dict[str, Any]) -> None:
+        if "content" in updates:
+            todo.content = updates["content"]
+        if "status" in updates:
+            todo.status = TodoStatus(updates["status"])
+        if "priority" in updates:
+            todo.priority = TodoPriority(updates["priority"])
 
     def update_todo(
         self, todo_id: str, updates: Dict[str, Any], agent_id: Optional[str] = None
     ) -> bool:
         """Update a specific todo. Returns True if found and updated."""
-        todos = self.get_todos(agent_id)
-
-        for todo in todos:
-            if todo.id == todo_id:
-                if "content" in updates:
-                    todo.content = updates["content"]
-                if "status" in updates:
-                    todo.status = TodoStatus(updates["status"])
-                if "priority" in updates:
-                    todo.priority = TodoPriority(updates["priority"])
-
-                self.set_todos(todos, agent_id)
-                return True
-
-        return False
+        return self.update_todos_bulk({todo_id: updates}, agent_id) == 1
+
+    def update_todos_bulk(
+        self, updates: Dict[str, Dict[str, Any]], agent_id: Optional[str] = None
+    ) -> int:
+        """Apply ``{todo_id: updates}`` with one id lookup each and one write.
+
+        Returns the number of todos that were found and updated.
+        """
+        with self._lock:
+            self._raise_write_error()
+            # Validate everything first so a bad value can't leave the cache
+            # holding a half-applied batch
+            for todo_updates in updates.values():
+                if "status" in todo_updates:
+                    TodoStatus(todo_updates["status"])
+                if "priority" in todo_updates:
+                    TodoPriority(todo_updates["priority"])
+
+            self._load(agent_id)
+            by_id = self._by_id[agent_id]
+            updated = 0
+            for todo_id, todo_updates in updates.items():
+                todo = by_id.get(todo_id)
+                if todo is not None:
+                    self._apply_updates(todo, todo_updates)
+                    updated += 1
+
+            if updated:
+                self._mark_dirty(agent_id)
+            return updated
 
     def remove_todo(self, todo_id: str, agent_id: Optional[str] = None) -> bool:
         """Remove a todo by ID. Returns True if found and removed."""
-        todos = self.get_todos(agent_id)
-        original_length = len(todos)
+        with self._lock:
+            self._raise_write_error()
+            todos = self._load(agent_id)
+            if todo_id not in self._by_id[agent_id]:
+                return False
 
-        todos = [todo for todo in todos if todo.id != todo_id]
-
-        if len(todos) < original_length:
-            self.set_todos(todos, agent_id)
+            self._mark_dirty(agent_id, [todo for todo in todos if todo.id != todo_id])
             return True
 
-        return False
-
     def clear_todos(self, agent_id: Optional[str] = None) -> None:
         """Clear all todos for a specific agent."""
         self.set_todos([], agent_id)
 
 
+# Every TodoStorage, so pending writes are flushed at interpreter exit
+_live_storages: "weakref.WeakSet[TodoStorage]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_storages() -> None:
+    for storage in list(_live_storages):
+        try:
+            storage.flush_sync()
+        except Exception as e:
+            logger.warning(f"Failed to write pending todos at exit: {e}")
+
+
 _storage: Optional[TodoStorage] = None
 
 
@@ -157,6 +349,13 @@ def update_todo(
     return _get_storage().update_todo(todo_id, updates, agent_id)
 
 
+def update_todos_bulk(
+    updates: Dict[str, Dict[str, Any]], agent_id: Optional[str] = None
+) -> int:
+    """Update several todos in global storage with a single write."""
+    return _get_storage().update_todos_bulk(updates, agent_id)
+
+
 def remove_todo(todo_id: str, agent_id: Optional[str] = None) -> bool:
     """Remove todo from global storage."""
     return _get_storage().remove_todo(todo_id, agent_id)
@@ -7,7 +7,7 @@ This adapter outputs events to an asyncio.Queue for SSE streaming.
 It follows the A2A-style input_required pattern for bidirectional interactions.
 """
 
-from typing import List, Optional, Dict, Any, Literal
+from typing import Callable, List, Optional, Dict, Any, Literal
 import asyncio
 import time
 from dataclasses import dataclass, field, asdict
@@ -77,17 +77,20 @@ class InputRequest:
     timeout_seconds: Optional[int] = 300
 
 
-@dataclass
+@dataclass(slots=True)
 class SSEEvent:
     """Server-Sent Event data structure"""
 
     type: str
     data: Dict[str, Any]
     task_id: Optional[str] = None
-    timestamp: float = field(default_factory=time.time)
+    # Wall-clock seconds; None means "stamp when sent", so a batch of events
+    # written together needs only one clock read
+    timestamp: Optional[float] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {"type": self.type, "timestamp": self.timestamp, **self.data}
+        timestamp = self.timestamp if self.timestamp is not None else time.time()
+        result = {"type": self.type, "timestamp": timestamp, **self.data}
         if self.task_id:
             result["task_id"] = self.task_id
         return result
@@ -101,6 +104,26 @@ class PendingInteraction:
     kind: str
     data: Dict[str, Any]
     future: asyncio.Future
+    # Resolves the future with the default once the timeout passes
+    timer_handle: Optional[asyncio.TimerHandle] = None
+
+
+class _EventQueue(asyncio.Queue):
+    """asyncio.Queue whose size bound applies to awaited puts only.
+
+    Synchronous emits cannot wait for the consumer, so they are always
+    queued; only async producers are held back (and eventually give up) on
+    a full queue.
+    """
+
+    def put_nowait_unbounded(self, item: SSEEvent) -> None:
+        """Queue ``item`` now, even past maxsize."""
+        maxsize = self._maxsize
+        self._maxsize = 0
+        try:
+            self.put_nowait(item)
+        finally:
+            self._maxsize = maxsize
 
 
 class WebOutputAdapter(OutputAdapter):
@@ -121,7 +144,13 @@ class WebOutputAdapter(OutputAdapter):
     """
 
     def __init__(
-        self, session_id: str, task_id: Optional[str] = None, timeout_seconds: int = 300
+        self,
+        session_id: str,
+        task_id: Optional[str] = None,
+        timeout_seconds: int = 300,
+        max_queue_size: int = 1000,
+        put_timeout: float = 5.0,
+        on_slow_client: Optional[Callable[[], None]] = None,
     ):
         """
         Initialize Web adapter.
@@ -130,13 +159,32 @@ class WebOutputAdapter(OutputAdapter):
             session_id: Session identifier
             task_id: Current task identifier (set per query)
             timeout_seconds: Default timeout for interactions
+            max_queue_size: Most events buffered before async emits wait for
+                the SSE client; sync emits are queued regardless
+            put_timeout: Seconds an async emit waits on a full queue before
+                giving up on the client
+            on_slow_client: Called when that happens, e.g. to abort the task
         """
         self.session_id = session_id
         self.task_id = task_id
         self.timeout_seconds = timeout_seconds
-
-        # Event queue for SSE output
-        self.event_queue: asyncio.Queue[SSEEvent] = asyncio.Queue()
+        self.put_timeout = put_timeout
+        self.on_slow_client = on_slow_client
+
+        # Event queue for SSE output, bounded so a slow client applies
+        # backpressure to async producers instead of growing server memory
+        self.event_queue: _EventQueue = _EventQueue(maxsize=max_queue_size)
+        # Set when an async emit timed out on a full queue this task
+        self._client_slow = False
+        # Events discarded after giving up on a slow client
+        self.dropped_events = 0
+        # Loop that owns event_queue, for emits from other threads
+        try:
+            self._loop: Optional[asyncio.AbstractEventLoop] = (
+                asyncio.get_running_loop()
+            )
+        except RuntimeError:
+            self._loop = None
 
         # Pending interactions waiting for user response
         self._pending_interactions: Dict[str, PendingInteraction] = {}
@@ -150,6 +198,7 @@ class WebOutputAdapter(OutputAdapter):
         """Set current task ID for new query."""
         self.task_id = task_id
         self._task_state = TaskState.SUBMITTED
+        self._client_slow = False
 
     def _generate_interaction_id(self) -> str:
         """Generate unique interaction ID."""
@@ -164,16 +213,54 @@ class WebOutputAdapter(OutputAdapter):
     async def _emit_event(self, event_type: str, data: Dict[str, Any]):
         """Emit SSE event to queue."""
         event = SSEEvent(type=event_type, data=data, task_id=self.task_id)
-        await self.event_queue.put(event)
-
-    def _emit_event_sync(self, event_type: str, data: Dict[str, Any]):
-        """Emit SSE event synchronously (for non-async methods)."""
-        event = SSEEvent(type=event_type, data=data, task_id=self.task_id)
-        # Use put_nowait for sync context
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        # Common case: room in the queue, so no suspension at all
         try:
             self.event_queue.put_nowait(event)
+            return
         except asyncio.QueueFull:
-            pass  # Drop event if queue is full
+            pass
+        if self._client_slow:
+            # Already gave up on this client; don't stall every emit again
+            self.dropped_events += 1
+            return
+        try:
+            await asyncio.wait_for(
+                self.event_queue.put(event), timeout=self.put_timeout
+            )
+        except asyncio.TimeoutError:
+            self._client_slow = True
+            self.dropped_events += 1
+            if self.on_slow_client is not None:
+                self.on_slow_client()
+
+    def _emit_event_sync(self, event_type: str, data: Dict[str, Any]):
+        """Emit SSE event without waiting (for non-async methods).
+
+        The event is queued even when the queue is full, since a sync caller
+        cannot wait for the client to catch up. Safe to call from worker
+        threads: the put is handed to the loop that owns the queue, since
+        asyncio.Queue is not thread-safe.
+        """
+        event = SSEEvent(type=event_type, data=data, task_id=self.task_id)
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is not loop:
+                loop.call_soon_threadsafe(self._put_sync, event)
+                return
+        self._put_sync(event)
+
+    def _put_sync(self, event: SSEEvent) -> None:
+        """Queue ``event`` past the bound, unless the client was given up on."""
+        if self._client_slow:
+            self.dropped_events += 1
+            return
+        self.event_queue.put_nowait_unbounded(event)
 
     async def emit_task_status(self, state: TaskState):
         """Emit task status change event."""
@@ -200,42 +287,38 @@ class WebOutputAdapter(OutputAdapter):
         """Send text output as SSE event."""
         self._emit_event_sync("text", {"content": content, "style": style})
 
-    async def confirm(
+    async def _await_interaction(
         self,
-        message: str,
-        title: str = "Confirm",
-        default: bool = False,
-        ok_text: str = "Yes",
-        cancel_text: str = "No",
-        resource_type: Optional[str] = None,
-        resource_name: Optional[str] = None,
-        resource_args: Optional[Dict[str, Any]] = None,
-    ) -> bool:
+        kind: str,
+        pending_data: Dict[str, Any],
+        request: Dict[str, Any],
+        default: Any,
+    ) -> Any:
         """
-        Request user confirmation via input_required event.
+        Send an input_required request and wait for the user's response.
 
-        This method:
-        1. Changes task state to input_required
-        2. Sends input_required SSE event
-        3. Creates Future and waits for response
-        4. Changes task state back to working
+        The task state is input_required while waiting and working again
+        afterwards. Returns ``default`` if nobody answers within
+        timeout_seconds; the timer is cancelled as soon as the interaction
+        is resolved.
+
+        Args:
+            kind: InputKind value
+            pending_data: Data kept on the PendingInteraction
+            request: title, message and data for the input_required request
+            default: Result when the interaction times out
         """
         interaction_id = self._generate_interaction_id()
-        future: asyncio.Future[bool] = asyncio.Future()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
 
-        # Store pending interaction
-        self._pending_interactions[interaction_id] = PendingInteraction(
+        interaction = PendingInteraction(
             interaction_id=interaction_id,
-            kind=InputKind.PERMISSION.value,
-            data={
-                "message": message,
-                "title": title,
-                "default": default,
-                "ok_text": ok_text,
-                "cancel_text": cancel_text,
-            },
+            kind=kind,
+            data=pending_data,
             future=future,
         )
+        self._pending_interactions[interaction_id] = interaction
 
         # Change state to input_required
         await self.emit_task_status(TaskState.INPUT_REQUIRED)
@@ -246,33 +329,82 @@ class WebOutputAdapter(OutputAdapter):
             {
                 "request": {
                     "interaction_id": interaction_id,
-                    "kind": InputKind.PERMISSION.value,
-                    "title": title,
-                    "message": message,
-                    "data": {
-                        "resource_type": resource_type or "action",
-                        "resource_name": resource_name or title,
-                        "resource_args": resource_args,
-                        "default": default,
-                        "ok_text": ok_text,
-                        "cancel_text": cancel_text,
-                    },
+                    "kind": kind,
+                    **request,
                     "timeout_seconds": self.timeout_seconds,
                 }
             },
         )
 
+        if self.timeout_seconds is not None:
+            interaction.timer_handle = loop.call_later(
+                self.timeout_seconds, self._settle, interaction, default
+            )
+
         # Wait for user response
         try:
-            result = await asyncio.wait_for(future, timeout=self.timeout_seconds)
-            return result
-        except asyncio.TimeoutError:
-            return default
+            return await future
         finally:
+            if interaction.timer_handle is not None:
+                interaction.timer_handle.cancel()
             self._pending_interactions.pop(interaction_id, None)
             # Change state back to working
             await self.emit_task_status(TaskState.WORKING)
 
+    @staticmethod
+    def _settle(interaction: PendingInteraction, result: Any) -> bool:
+        """Complete an interaction's future once, cancelling its timeout."""
+        if interaction.future.done():
+            return False
+        if interaction.timer_handle is not None:
+            interaction.timer_handle.cancel()
+        interaction.future.set_result(result)
+        return True
+
+    async def confirm(
+        self,
+        message: str,
+        title: str = "Confirm",
+        default: bool = False,
+        ok_text: str = "Yes",
+        cancel_text: str = "No",
+        resource_type: Optional[str] = None,
+        resource_name: Optional[str] = None,
+        resource_args: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Request user confirmation via input_required event.
+
+        This method:
+        1. Changes task state to input_required
+        2. Sends input_required SSE event
+        3. Creates Future and waits for response
+        4. Changes task state back to working
+        """
+        return await self._await_interaction(
+            InputKind.PERMISSION.value,
+            {
+                "message": message,
+                "title": title,
+                "default": default,
+                "ok_text": ok_text,
+                "cancel_text": cancel_text,
+            },
+            {
+                "title": title,
+                "message": message,
+                "data": {
+                    "resource_type": resource_type or "action",
+                    "resource_name": resource_name or title,
+                    "resource_args": resource_args,
+                    "default": default,
+                    "ok_text": ok_text,
+                    "cancel_text": cancel_text,
+                },
+            },
+            default=default,
+        )
+
     async def choice(
         self,
         message: str,
@@ -285,51 +417,27 @@ class WebOutputAdapter(OutputAdapter):
 
         Returns the selected index (0-based), or -1 if cancelled/timeout.
         """
-        interaction_id = self._generate_interaction_id()
-        future: asyncio.Future[int] = asyncio.Future()
-
-        self._pending_interactions[interaction_id] = PendingInteraction(
-            interaction_id=interaction_id,
-            kind=InputKind.CHOICE.value,
-            data={
+        return await self._await_interaction(
+            InputKind.CHOICE.value,
+            {
                 "message": message,
                 "choices": choices,
                 "title": title,
                 "default_index": default_index,
             },
-            future=future,
-        )
-
-        await self.emit_task_status(TaskState.INPUT_REQUIRED)
-
-        await self._emit_event(
-            "input_required",
             {
-                "request": {
-                    "interaction_id": interaction_id,
-                    "kind": InputKind.CHOICE.value,
-                    "title": title,
-                    "message": message,
-                    "data": {
-                        "choices": [
-                            {"label": c, "value": i} for i, c in enumerate(choices)
-                        ],
-                        "default_index": default_index,
-                    },
-                    "timeout_seconds": self.timeout_seconds,
-                }
+                "title": title,
+                "message": message,
+                "data": {
+                    "choices": [
+                        {"label": c, "value": i} for i, c in enumerate(choices)
+                    ],
+                    "default_index": default_index,
+                },
             },
+            default=-1,
         )
 
-        try:
-            result = await asyncio.wait_for(future, timeout=self.timeout_seconds)
-            return result
-        except asyncio.TimeoutError:
-            return -1
-        finally:
-            self._pending_interactions.pop(interaction_id, None)
-            await self.emit_task_status(TaskState.WORKING)
-
     async def input(
         self,
         message: str,
@@ -342,46 +450,22 @@ class WebOutputAdapter(OutputAdapter):
 
         Returns the input string, or None if cancelled/timeout.
         """
-        interaction_id = self._generate_interaction_id()
-        future: asyncio.Future[Optional[str]] = asyncio.Future()
-
-        self._pending_interactions[interaction_id] = PendingInteraction(
-            interaction_id=interaction_id,
-            kind=InputKind.TEXT.value,
-            data={
+        return await self._await_interaction(
+            InputKind.TEXT.value,
+            {
                 "message": message,
                 "title": title,
                 "default": default,
                 "placeholder": placeholder,
             },
-            future=future,
-        )
-
-        await self.emit_task_status(TaskState.INPUT_REQUIRED)
-
-        await self._emit_event(
-            "input_required",
             {
-                "request": {
-                    "interaction_id": interaction_id,
-                    "kind": InputKind.TEXT.value,
-                    "title": title,
-                    "message": message,
-                    "data": {"placeholder": placeholder, "default_value": default},
-                    "timeout_seconds": self.timeout_seconds,
-                }
+                "title": title,
+                "message": message,
+                "data": {"placeholder": placeholder, "default_value": default},
             },
+            default=None,
         )
 
-        try:
-            result = await asyncio.wait_for(future, timeout=self.timeout_seconds)
-            return result
-        except asyncio.TimeoutError:
-            return None
-        finally:
-            self._pending_interactions.pop(interaction_id, None)
-            await self.emit_task_status(TaskState.WORKING)
-
     async def form(
         self,
         message: str,
@@ -392,9 +476,6 @@ class WebOutputAdapter(OutputAdapter):
         """
         Request structured form input via a single input_required event.
         """
-        interaction_id = self._generate_interaction_id()
-        future: asyncio.Future[Optional[Dict[str, Any]]] = asyncio.Future()
-
         ui_schema = {
             "protocol": "a2ui/v1",
             "renderer": "json_form",
@@ -405,51 +486,31 @@ class WebOutputAdapter(OutputAdapter):
             "fields": fields,
         }
 
-        self._pending_interactions[interaction_id] = PendingInteraction(
-            interaction_id=interaction_id,
-            kind=InputKind.FORM.value,
-            data={
+        result = await self._await_interaction(
+            InputKind.FORM.value,
+            {
                 "message": message,
                 "title": title,
                 "fields": fields,
                 "submit_text": submit_text,
                 "ui_schema": ui_schema,
             },
-            future=future,
-        )
-
-        await self.emit_task_status(TaskState.INPUT_REQUIRED)
-
-        await self._emit_event(
-            "input_required",
             {
-                "request": {
-                    "interaction_id": interaction_id,
-                    "kind": InputKind.FORM.value,
-                    "title": title,
-                    "message": message,
-                    "data": {
-                        "fields": fields,
-                        "submit_text": submit_text,
-                        "ui_schema": ui_schema,
-                    },
-                    "timeout_seconds": self.timeout_seconds,
-                }
+                "title": title,
+                "message": message,
+                "data": {
+                    "fields": fields,
+                    "submit_text": submit_text,
+                    "ui_schema": ui_schema,
+                },
             },
+            default=None,
         )
-
-        try:
-            result = await asyncio.wait_for(future, timeout=self.timeout_seconds)
-            if result is None:
-                return None
-            if not isinstance(result, dict):
-                return {"value": result}
-            return result
-        except asyncio.TimeoutError:
+        if result is None:
             return None
-        finally:
-            self._pending_interactions.pop(interaction_id, None)
-            await self.emit_task_status(TaskState.WORKING)
+        if not isinstance(result, dict):
+            return {"value": result}
+        return result
 
     def print(self, *args, **kwargs) -> None:
         """Generic print - converts to text output."""
@@ -473,9 +534,8 @@ class WebOutputAdapter(OutputAdapter):
             True if interaction was found and resolved, False otherwise
         """
         interaction = self._pending_interactions.get(interaction_id)
-        if interaction and not interaction.future.done():
-            interaction.future.set_result(result)
-            return True
+        if interaction:
+            return self._settle(interaction, result)
         return False
 
     def cancel_interaction(self, interaction_id: str) -> bool:
@@ -487,13 +547,13 @@ class WebOutputAdapter(OutputAdapter):
         interaction = self._pending_interactions.get(interaction_id)
         if interaction and not interaction.future.done():
             if interaction.kind == InputKind.PERMISSION.value:
-                interaction.future.set_result(False)
+                self._settle(interaction, False)
             elif interaction.kind == InputKind.CHOICE.value:
-                interaction.future.set_result(-1)
+                self._settle(interaction, -1)
             elif interaction.kind == InputKind.TEXT.value:
-                interaction.future.set_result(None)
+                self._settle(interaction, None)
             elif interaction.kind == InputKind.FORM.value:
-                interaction.future.set_result(None)
+                self._settle(interaction, None)
             return True
         return False
 
@@ -554,46 +614,22 @@ class WebOutputAdapter(OutputAdapter):
         Returns:
             True if user allows, False if denied or timeout
         """
-        interaction_id = self._generate_interaction_id()
-        future: asyncio.Future[bool] = asyncio.Future()
-
-        self._pending_interactions[interaction_id] = PendingInteraction(
-            interaction_id=interaction_id,
-            kind=InputKind.PERMISSION.value,
-            data={
+        return await self._await_interaction(
+            InputKind.PERMISSION.value,
+            {
                 "tool_name": tool_name,
                 "tool_args": tool_args,
                 "description": description,
             },
-            future=future,
-        )
-
-        await self.emit_task_status(TaskState.INPUT_REQUIRED)
-
-        await self._emit_event(
-            "input_required",
             {
-                "request": {
-                    "interaction_id": interaction_id,
-                    "kind": InputKind.PERMISSION.value,
-                    "title": f"Allow {tool_name}?",
-                    "message": description or f"Agent wants to execute {tool_name}",
-                    "data": {
-                        "resource_type": "tool",
-                        "resource_name": tool_name,
-                        "resource_args": tool_args,
-                        "risk_level": "medium",
-                    },
-                    "timeout_seconds": self.timeout_seconds,
-                }
+                "title": f"Allow {tool_name}?",
+                "message": description or f"Agent wants to execute {tool_name}",
+                "data": {
+                    "resource_type": "tool",
+                    "resource_name": tool_name,
+                    "resource_args": tool_args,
+                    "risk_level": "medium",
+                },
             },
+            default=False,
         )
-
-        try:
-            result = await asyncio.wait_for(future, timeout=self.timeout_seconds)
-            return result
-        except asyncio.TimeoutError:
-            return False
-        finally:
-            self._pending_interactions.pop(interaction_id, None)
-            await self.emit_task_status(TaskState.WORKING)
@@ -9,7 +9,9 @@ Handles chat messages and returns streaming responses via Server-Sent Events.
 import asyncio
 import json
 import logging
-from typing import Optional, AsyncGenerator
+import sys
+import time
+from typing import AsyncGenerator, List, Optional
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
@@ -18,10 +20,24 @@ from pydantic import BaseModel, Field
 from ..services.session_manager import session_manager, HistoryMode
 from ..adapters.web_adapter import TaskState, SSEEvent
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
+# Most queued events forwarded per wakeup, so one burst can't delay the stream
+_MAX_BATCH_EVENTS = 256
+# Streaming chunk events whose adjacent chunks can be joined into one event
+_MERGEABLE_EVENT_TYPES = frozenset({"content", "thinking"})
+# Python 3.12+ can run a new task inline until it first suspends
+_EAGER_START = sys.version_info >= (3, 12)
+
 
 class ChatRequest(BaseModel):
     """Request body for chat endpoint."""
@@ -32,20 +48,100 @@ class ChatRequest(BaseModel):
     )
 
 
-def format_sse_event(event: SSEEvent) -> str:
-    """Format event as SSE string."""
-    data = json.dumps(event.to_dict(), ensure_ascii=False)
-    return f"data: {data}\n\n"
+def format_sse_event(event: SSEEvent, now: Optional[float] = None) -> bytes:
+    """Format event as an SSE frame, ready to write to the response.
 
+    Events without a timestamp are stamped with ``now`` (or the current time).
+    """
+    timestamp = event.timestamp
+    if timestamp is None:
+        timestamp = time.time() if now is None else now
+    # Same payload as SSEEvent.to_dict(), built inline on this hot path
+    payload = {"type": event.type, "timestamp": timestamp, **event.data}
+    if event.task_id:
+        payload["task_id"] = event.task_id
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return b"data: " + data + b"\n\n"
+
+
+def _start_task(coro) -> asyncio.Future:
+    """Wrap ``coro`` in a task, starting it eagerly where supported.
+
+    An eager task that finishes without suspending (a queue get with an event
+    waiting, an agent turn that emits without blocking) completes without a
+    round trip through the event loop. This is scoped to the chat stream
+    rather than installed as the loop's task factory for the whole server.
+    """
+    if _EAGER_START:
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+    return asyncio.ensure_future(coro)
 
-def format_sse_done() -> str:
+
+def _drain_batch(first: SSEEvent, queue: "asyncio.Queue[SSEEvent]") -> List[SSEEvent]:
+    """Return ``first`` plus events already queued behind it.
+
+    Runs of adjacent content or thinking events from the same task are joined
+    into a single event whose chunk is their concatenation, so clients that
+    append chunks see the same text with fewer frames.
+    """
+    batch: List[SSEEvent] = []
+    parts: List[str] = []
+
+    def close_run():
+        if len(parts) > 1:
+            last = batch[-1]
+            batch[-1] = SSEEvent(
+                type=last.type,
+                data={"chunk": "".join(parts)},
+                task_id=last.task_id,
+                timestamp=last.timestamp,
+            )
+        parts.clear()
+
+    event = first
+    while True:
+        mergeable = (
+            event.type in _MERGEABLE_EVENT_TYPES and event.data.keys() == {"chunk"}
+        )
+        if (
+            parts
+            and mergeable
+            and event.type == batch[-1].type
+            and event.task_id == batch[-1].task_id
+        ):
+            parts.append(event.data["chunk"])
+        else:
+            close_run()
+            batch.append(event)
+            if mergeable:
+                parts.append(event.data["chunk"])
+        if len(batch) >= _MAX_BATCH_EVENTS:
+            break
+        try:
+            event = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+    close_run()
+    return batch
+
+
+def _format_batch(batch: List[SSEEvent]) -> bytes:
+    """Format several events as one write, reading the clock once."""
+    now = time.time()
+    return b"".join([format_sse_event(event, now) for event in batch])
+
+
+def format_sse_done() -> bytes:
     """Format done event."""
-    return "data: [DONE]\n\n"
+    return b"data: [DONE]\n\n"
 
 
 async def process_chat_stream(
     session_id: str, message: str, history_mode: Optional[HistoryMode] = None
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Process chat message and yield SSE events.
 
@@ -166,26 +262,40 @@ async def process_chat_stream(
                             await session.adapter.emit_content(chunk_content)
 
             # Start agent execution in background
-            agent_task = asyncio.create_task(run_agent())
-
-            # Forward events from adapter queue to SSE
+            agent_task = _start_task(run_agent())
+            event_queue = session.adapter.event_queue
+            # Wait on this Event object itself: aborting swaps in a fresh one
+            abort_waiter = _start_task(session.abort_event.wait())
+            get_task: Optional[asyncio.Future] = None
+
+            # Forward events from adapter queue to SSE, waking only when an
+            # event arrives, the agent finishes or the task is aborted
             try:
                 while True:
-                    try:
-                        # Try to get event with timeout
-                        event = await asyncio.wait_for(
-                            session.adapter.event_queue.get(), timeout=0.1
-                        )
-                        yield format_sse_event(event)
-                    except asyncio.TimeoutError:
-                        pass
+                    if get_task is None:
+                        get_task = _start_task(event_queue.get())
+                    done, _ = await asyncio.wait(
+                        {get_task, agent_task, abort_waiter},
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+
+                    if get_task in done:
+                        event = get_task.result()
+                        get_task = None
+                        yield _format_batch(_drain_batch(event, event_queue))
+                        continue
 
                     # Check if agent is done
-                    if agent_task.done():
+                    if agent_task in done:
+                        get_task.cancel()
+                        get_task = None
                         # Drain remaining events
-                        while not session.adapter.event_queue.empty():
-                            event = await session.adapter.event_queue.get()
-                            yield format_sse_event(event)
+                        while True:
+                            try:
+                                event = event_queue.get_nowait()
+                            except asyncio.QueueEmpty:
+                                break
+                            yield _format_batch(_drain_batch(event, event_queue))
 
                         # Check for exception
                         if agent_task.exception():
@@ -193,25 +303,33 @@ async def process_chat_stream(
 
                         break
 
-                    # Check for abort
-                    if session.abort_event.is_set():
-                        agent_task.cancel()
-                        was_cancelled = True
-                        yield format_sse_event(
-                            SSEEvent(
-                                type="task_status",
-                                data={
-                                    "state": TaskState.CANCELLED.value,
-                                    "task_id": task_id,
-                                },
-                                task_id=task_id,
-                            )
+                    # Aborted
+                    agent_task.cancel()
+                    was_cancelled = True
+                    yield format_sse_event(
+                        SSEEvent(
+                            type="task_status",
+                            data={
+                                "state": TaskState.CANCELLED.value,
+                                "task_id": task_id,
+                            },
+                            task_id=task_id,
                         )
-                        break
+                    )
+                    break
 
             except Exception as e:
                 logger.error(f"Error in event forwarding: {e}")
                 raise
+            finally:
+                if get_task is not None:
+                    get_task.cancel()
+                abort_waiter.cancel()
+                # If the stream stopped for any other reason (client gone,
+                # forwarding error), don't leave the agent running unobserved
+                # once the processing lock is released
+                if not agent_task.done():
+                    agent_task.cancel()
 
             if was_cancelled:
                 return
@@ -11,7 +11,6 @@ Supports two history modes:
 
 import asyncio
 import time
-import uuid
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -73,6 +72,10 @@ class WebSession:
         """Update last activity timestamp."""
         self.last_activity = time.time()
 
+    def signal_abort(self):
+        """Signal abort on the current abort event."""
+        self.abort_event.set()
+
     def generate_task_id(self) -> str:
         """Generate unique task ID."""
         return f"task_{self.session_id}_{int(time.time() * 1000)}"
@@ -127,8 +130,11 @@ class SessionManager:
             if len(self.sessions) >= self.max_sessions:
                 raise Exception("Maximum sessions reached")
 
-            # Generate session ID
-            session_id = str(uuid.uuid4())[:8]
+            # Create persistent storage session; its time-ordered ID is shared
+            # with the web session
+            resolved_path = str(Path(project_path).resolve())
+            storage_session = self.storage.create_session(resolved_path)
+            session_id = storage_session.metadata.session_id
 
             # Create adapter
             adapter = WebOutputAdapter(session_id=session_id)
@@ -136,16 +142,13 @@ class SessionManager:
             # Create web session
             session = WebSession(
                 session_id=session_id,
-                project_path=str(Path(project_path).resolve()),
+                project_path=resolved_path,
                 adapter=adapter,
                 history_mode=history_mode or self.default_history_mode,
             )
-
-            # Create persistent storage session
-            storage_session = self.storage.create_session(session.project_path)
-            # Override session_id to match web session
-            storage_session.metadata.session_id = session_id
             session._storage_session = storage_session
+            # A client that stops reading the stream aborts its running task
+            adapter.on_slow_client = session.signal_abort
 
             self.sessions[session_id] = session
             logger.info(
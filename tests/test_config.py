@@ -0,0 +1,261 @@
+"""Tests for global config loading and caching."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+from minion_code.utils.config import (
+    ConfigManager,
+    GlobalConfig,
+    ModelPointers,
+    ModelProfile,
+    ProjectConfig,
+)
+
+
+def _write_config(path: Path, data: dict, mtime_ns: int) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_get_global_config_reuses_parse_until_file_changes(
+    tmp_path: Path, monkeypatch
+):
+    """config.json should only be re-parsed when its mtime changes."""
+    manager = ConfigManager(config_dir=tmp_path)
+    _write_config(manager.global_config_file, {"theme": "light"}, 1_000_000_000)
+
+    loads = []
+    original_load = manager._load_config
+
+    def counting_load(*args, **kwargs):
+        loads.append(args[0])
+        return original_load(*args, **kwargs)
+
+    monkeypatch.setattr(manager, "_load_config", counting_load)
+
+    first = manager.get_global_config()
+    first.theme = "mutated"
+    second = manager.get_global_config()
+
+    assert second.theme == "light"
+    assert len(loads) == 1
+
+    _write_config(manager.global_config_file, {"theme": "dark"}, 2_000_000_000)
+
+    assert manager.get_global_config().theme == "dark"
+    assert len(loads) == 2
+
+
+def test_save_global_config_writes_through_cache(tmp_path: Path, monkeypatch):
+    """Saving should not re-read config.json, nor should the next get."""
+    manager = ConfigManager(config_dir=tmp_path)
+    monkeypatch.setattr(manager, "_is_test_env", lambda: False)
+    _write_config(
+        manager.global_config_file,
+        {"projects": {"/work": {"history": ["ls"]}}},
+        1_000_000_000,
+    )
+
+    config = manager.get_global_config()
+    config.theme = "light"
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("config.json should not be re-read")
+
+    monkeypatch.setattr(manager, "_load_config", fail_load)
+    manager.save_global_config(config)
+
+    reloaded = manager.get_global_config()
+    assert reloaded.theme == "light"
+    assert reloaded.projects == {"/work": ProjectConfig(history=["ls"])}
+    assert json.loads(manager.global_config_file.read_text())["theme"] == "light"
+
+
+def test_migrate_model_profiles_is_noop_for_typed_profiles(tmp_path: Path):
+    """Raw profiles are migrated once; typed profiles are returned untouched."""
+    manager = ConfigManager(config_dir=tmp_path)
+    config = GlobalConfig(
+        model_profiles=[
+            {
+                "id": "legacy-id",
+                "name": "GPT",
+                "provider": "openai",
+                "model_name": "gpt-4o",
+                "api_key": "sk-test",
+                "max_tokens": 4096,
+                "context_length": 128000,
+                "created_at": 1,
+            }
+        ],
+        model_pointers={"main": "legacy-id"},
+    )
+
+    migrated = manager._migrate_model_profiles_remove_id(config)
+    profile = migrated.model_profiles[0]
+
+    assert isinstance(profile, ModelProfile)
+    assert migrated.model_pointers == ModelPointers(main="gpt-4o")
+    assert manager._migrate_model_profiles_remove_id(migrated) is migrated
+    assert migrated.model_profiles[0] is profile
+
+
+def test_api_key_and_trust_lookups_follow_config_changes(tmp_path: Path, monkeypatch):
+    """Indexed lookups should be rebuilt when config.json changes."""
+    manager = ConfigManager(config_dir=tmp_path)
+    project = tmp_path / "project"
+    nested = project / "src"
+    monkeypatch.setattr(manager, "_get_current_project_path", lambda: str(nested))
+    _write_config(
+        manager.global_config_file,
+        {
+            "custom_api_key_responses": {"approved": ["key-a"], "rejected": ["key-b"]},
+            "projects": {str(project): {"has_trust_dialog_accepted": True}},
+        },
+        1_000_000_000,
+    )
+
+    assert manager.get_custom_api_key_status("key-a") == "approved"
+    assert manager.get_custom_api_key_status("key-b") == "rejected"
+    assert manager.get_custom_api_key_status("key-c") == "new"
+    assert manager.check_has_trust_dialog_accepted() is True
+
+    _write_config(
+        manager.global_config_file,
+        {"custom_api_key_responses": {"approved": ["key-c"], "rejected": []}},
+        2_000_000_000,
+    )
+
+    assert manager.get_custom_api_key_status("key-a") == "new"
+    assert manager.get_custom_api_key_status("key-c") == "approved"
+    assert manager.check_has_trust_dialog_accepted() is False
+
+
+def test_model_profile_created_at_defaults_to_now_ms():
+    before = int(time.time() * 1000) - 1
+    profile = ModelProfile(
+        name="GPT",
+        provider="openai",
+        model_name="gpt-4o",
+        api_key="sk-test",
+        max_tokens=4096,
+        context_length=128000,
+    )
+
+    assert before <= profile.created_at <= int(time.time() * 1000) + 1
+
+
+def test_validate_and_repair_gpt5_profile_does_not_mutate_input(tmp_path: Path):
+    manager = ConfigManager(config_dir=tmp_path)
+    profile = ModelProfile(
+        name="GPT-5",
+        provider="openai",
+        model_name="gpt-5",
+        api_key="sk-test",
+        max_tokens=1000,
+        context_length=32000,
+    )
+
+    repaired = manager.validate_and_repair_gpt5_profile(profile)
+
+    assert repaired is not profile
+    assert profile.validation_status is None
+    assert repaired.validation_status == "auto_repaired"
+    assert (repaired.max_tokens, repaired.context_length) == (8192, 128000)
+    assert repaired.reasoning_effort == "medium"
+    assert repaired.base_url == "https://api.openai.com/v1"
+
+    revalidated = manager.validate_and_repair_gpt5_profile(repaired)
+    assert revalidated.validation_status == "valid"
+
+
+def test_get_current_project_config_normalizes_stored_projects(
+    tmp_path: Path, monkeypatch
+):
+    """Projects load as ProjectConfig and callers get an independent copy."""
+    manager = ConfigManager(config_dir=tmp_path)
+    monkeypatch.setattr(manager, "_get_current_project_path", lambda: "/work")
+    _write_config(
+        manager.global_config_file,
+        {
+            "projects": {
+                "/work": {"allowed_tools": '["bash"]', "history": ["ls"]},
+            }
+        },
+        1_000_000_000,
+    )
+
+    project_config = manager.get_current_project_config()
+    assert isinstance(project_config, ProjectConfig)
+    assert project_config.allowed_tools == ["bash"]
+
+    project_config.history.append("pwd")
+    assert manager.get_current_project_config().history == ["ls"]
+
+
+def test_get_global_config_copies_are_independent(tmp_path: Path):
+    """Mutating a returned config must not leak into the cache."""
+    manager = ConfigManager(config_dir=tmp_path)
+    _write_config(
+        manager.global_config_file,
+        {
+            "custom_api_key_responses": {"approved": ["key-a"], "rejected": []},
+            "projects": {"/work": {"history": ["ls"], "context": {"k": "v"}}},
+        },
+        1_000_000_000,
+    )
+
+    config = manager.get_global_config()
+    config.custom_api_key_responses["approved"].append("key-b")
+    config.projects["/work"].history.append("pwd")
+    config.projects["/work"].context["k"] = "changed"
+    config.projects["/other"] = ProjectConfig()
+
+    fresh = manager.get_global_config()
+    assert fresh.custom_api_key_responses["approved"] == ["key-a"]
+    assert fresh.projects == {
+        "/work": ProjectConfig(history=["ls"], context={"k": "v"})
+    }
+
+
+def test_get_global_config_sees_same_mtime_rewrite(tmp_path: Path):
+    """A rewrite that keeps the mtime but changes the size is picked up."""
+    manager = ConfigManager(config_dir=tmp_path)
+    _write_config(manager.global_config_file, {"theme": "dark"}, 1_000_000_000)
+    assert manager.get_global_config().theme == "dark"
+
+    _write_config(manager.global_config_file, {"theme": "light"}, 1_000_000_000)
+
+    assert manager.get_global_config().theme == "light"
+
+
+def test_is_test_env_rechecks_until_positive(tmp_path: Path, monkeypatch):
+    """A manager first used outside a test must still notice a later test."""
+    manager = ConfigManager(config_dir=tmp_path)
+    monkeypatch.delenv("PYTHON_ENV", raising=False)
+    monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+    assert manager._is_test_env() is False
+
+    monkeypatch.setenv("PYTHON_ENV", "test")
+    assert manager._is_test_env() is True
+
+    monkeypatch.delenv("PYTHON_ENV")
+    assert manager._is_test_env() is True
+
+
+def test_get_global_config_copies_loaded_oauth_account(tmp_path: Path):
+    """oauth_account loads as a plain dict and must survive both cache paths."""
+    manager = ConfigManager(config_dir=tmp_path)
+    account = {"account_uuid": "u1", "email_address": "a@example.com"}
+    _write_config(
+        manager.global_config_file, {"oauth_account": account}, 1_000_000_000
+    )
+
+    first = manager.get_global_config()
+    first.oauth_account["email_address"] = "changed"
+    second = manager.get_global_config()
+
+    assert second.oauth_account == account
@@ -0,0 +1,83 @@
+"""Tests for command history helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import minion_code.utils.config as config_module
+from minion_code.utils import history
+from minion_code.utils.config import ConfigManager
+
+
+@pytest.fixture
+def isolated_config(tmp_path: Path, monkeypatch) -> ConfigManager:
+    manager = ConfigManager(config_dir=tmp_path)
+    monkeypatch.setattr(config_module, "config_manager", manager)
+    return manager
+
+
+def test_add_to_history_keeps_most_recent_first_and_bounded(isolated_config):
+    for index in range(history.MAX_HISTORY_ITEMS + 5):
+        history.add_to_history(f"cmd {index}")
+    history.add_to_history(f"cmd {history.MAX_HISTORY_ITEMS + 4}")
+
+    items = history.get_history()
+
+    assert len(items) == history.MAX_HISTORY_ITEMS
+    assert items[0] == f"cmd {history.MAX_HISTORY_ITEMS + 4}"
+    assert items[-1] == "cmd 5"
+
+
+def test_search_history_is_case_insensitive(isolated_config):
+    history.add_to_history("git status")
+    history.add_to_history("Git Commit")
+    history.add_to_history("ls -la")
+
+    assert history.search_history("GIT") == ["Git Commit", "git status"]
+    assert history.search_history("  commit ") == ["Git Commit"]
+    assert history.search_history("") == []
+
+
+def test_write_behind_coalesces_history_saves(isolated_config, monkeypatch):
+    monkeypatch.setenv("MINION_HISTORY_ASYNC", "1")
+    monkeypatch.setattr(history, "HISTORY_FLUSH_DELAY", 60)
+    saves = []
+    monkeypatch.setattr(
+        history,
+        "save_current_project_config",
+        lambda project_config: saves.append(list(project_config.history)),
+    )
+
+    history.add_to_history("one")
+    history.add_to_history("two")
+    history.add_to_history("three")
+
+    assert saves == []
+    assert history.get_history() == ["three", "two", "one"]
+
+    history.flush_history()
+
+    assert saves == [["three", "two", "one"]]
+    history.flush_history()
+    assert len(saves) == 1
+
+
+def test_add_to_history_trims_oversized_history_from_the_oldest_end(
+    isolated_config,
+):
+    """A stored history past the limit keeps its newest entries."""
+    project_config = isolated_config.get_current_project_config()
+    project_config.history = [
+        f"cmd {index}" for index in range(history.MAX_HISTORY_ITEMS + 50)
+    ]
+    isolated_config.save_current_project_config(project_config)
+
+    history.add_to_history("cmd 0")
+    history.add_to_history("latest")
+
+    items = history.get_history()
+    assert len(items) == history.MAX_HISTORY_ITEMS
+    assert items[:3] == ["latest", "cmd 0", "cmd 1"]
+    assert items[-1] == f"cmd {history.MAX_HISTORY_ITEMS - 2}"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -35,6 +36,30 @@ def test_find_mcp_config_prefers_project_then_minion_user_config(
     assert find_mcp_config(project_dir=project) == user_config
 
 
+def test_auto_discovered_config_is_not_reopened_on_first_load(
+    tmp_path: Path, monkeypatch
+):
+    """Bytes read during discovery should feed the first load_config()."""
+    home = tmp_path / "home"
+    project = tmp_path / "project"
+    home.mkdir()
+    project.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    (project / ".mcp.json").write_text(
+        json.dumps({"mcpServers": {"demo": {"command": "uvx"}}}), encoding="utf-8"
+    )
+
+    loader = MCPToolsLoader(project_dir=project)
+
+    def fail_read(*_args, **_kwargs):
+        raise AssertionError("config should not be re-read")
+
+    monkeypatch.setattr(mcp_loader_module, "_read_config_data", fail_read)
+
+    assert loader.config_path == project.resolve() / ".mcp.json"
+    assert set(loader.load_config()) == {"demo"}
+
+
 def test_loader_merges_global_and_project_servers_from_minion_json(tmp_path: Path):
     """~/.minion.json should merge global and closest project servers."""
     project_root = tmp_path / "project"
@@ -80,6 +105,69 @@ def test_loader_merges_global_and_project_servers_from_minion_json(tmp_path: Pat
     assert servers["override"].args == ["project-override"]
 
 
+def test_loader_reuses_parsed_config_until_file_changes(tmp_path: Path, monkeypatch):
+    """Unchanged config files should be parsed once across loaders."""
+    config_path = tmp_path / ".mcp.json"
+    config_path.write_text(
+        json.dumps({"mcpServers": {"demo": {"command": "uvx", "autoApprove": ["a"]}}}),
+        encoding="utf-8",
+    )
+    os.utime(config_path, ns=(1_000_000_000, 1_000_000_000))
+
+    parses = []
+    original_parse = mcp_loader_module._parse_config_bytes
+
+    def counting_parse(data):
+        parses.append(data)
+        return original_parse(data)
+
+    monkeypatch.setattr(mcp_loader_module, "_parse_config_bytes", counting_parse)
+
+    first = MCPToolsLoader(config_path=config_path, auto_discover=False).load_config()
+    first["demo"].auto_approve.append("b")
+    second = MCPToolsLoader(config_path=config_path, auto_discover=False).load_config()
+
+    assert len(parses) == 1
+    assert second["demo"].auto_approve == ["a"]
+
+    config_path.write_text(
+        json.dumps({"mcpServers": {"other": {"command": "uvx"}}}), encoding="utf-8"
+    )
+    os.utime(config_path, ns=(2_000_000_000, 2_000_000_000))
+
+    third = MCPToolsLoader(config_path=config_path, auto_discover=False).load_config()
+    assert set(third) == {"other"}
+    assert len(parses) == 2
+
+
+def test_load_config_short_circuits_while_file_is_unchanged(
+    tmp_path: Path, monkeypatch
+):
+    """Repeated load_config() on an unchanged file should return the same servers."""
+    config_path = tmp_path / ".mcp.json"
+    config_path.write_text(
+        json.dumps({"mcpServers": {"demo": {"command": "uvx"}}}), encoding="utf-8"
+    )
+    os.utime(config_path, ns=(1_000_000_000, 1_000_000_000))
+
+    loader = MCPToolsLoader(config_path=config_path, auto_discover=False)
+    servers = loader.load_config()
+
+    def fail_read(*_args, **_kwargs):
+        raise AssertionError("unchanged config should not be re-read")
+
+    monkeypatch.setattr(mcp_loader_module, "_read_config_data", fail_read)
+    assert loader.load_config() is servers
+
+    monkeypatch.undo()
+    config_path.write_text(
+        json.dumps({"mcpServers": {"other": {"command": "uvx"}}}), encoding="utf-8"
+    )
+    os.utime(config_path, ns=(2_000_000_000, 2_000_000_000))
+
+    assert set(loader.load_config()) == {"other"}
+
+
 def test_loader_parses_stdio_sse_and_http_servers(tmp_path: Path):
     """Loader should accept Claude-style stdio and remote transport entries."""
     config_path = tmp_path / ".mcp.json"
@@ -117,6 +205,48 @@ def test_loader_parses_stdio_sse_and_http_servers(tmp_path: Path):
     assert servers["http-server"].url == "https://example.com/mcp"
 
 
+def test_loader_treats_null_server_fields_as_empty(tmp_path: Path):
+    """Null args, env or autoApprove must not drop the server."""
+    config_path = tmp_path / ".mcp.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    "stdio-server": {
+                        "command": "uvx",
+                        "args": None,
+                        "env": None,
+                        "autoApprove": None,
+                    },
+                    "other": {"command": "npx", "args": ["other"]},
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    loader = MCPToolsLoader(config_path=config_path, auto_discover=False)
+    servers = loader.load_config()
+
+    assert set(servers) == {"stdio-server", "other"}
+    assert servers["stdio-server"].args == []
+    assert servers["stdio-server"].env == {}
+    assert servers["stdio-server"].auto_approve == []
+
+
+def test_mcp_framework_is_imported_on_first_use(monkeypatch):
+    """The MCP framework should be resolved lazily, keeping patched symbols."""
+    fake_toolset = type("FakeToolset", (), {})
+    monkeypatch.setattr(mcp_loader_module, "MCP_AVAILABLE", None)
+    monkeypatch.setattr(mcp_loader_module, "MCPToolset", fake_toolset)
+    monkeypatch.setattr(mcp_loader_module, "StdioServerParameters", None)
+
+    assert mcp_loader_module._load_mcp_framework() is True
+    assert mcp_loader_module.MCP_AVAILABLE is True
+    assert mcp_loader_module.MCPToolset is fake_toolset
+    assert mcp_loader_module.StdioServerParameters is not None
+
+
 @pytest.mark.asyncio
 async def test_loader_skips_cancelled_mcp_server(monkeypatch, tmp_path: Path):
     """A broken MCP server setup should be skipped instead of aborting all loading."""
@@ -216,6 +346,82 @@ async def test_loader_marks_timeout_without_blocking_other_servers(
     assert info["fast"]["tool_count"] == 1
 
 
+@pytest.mark.asyncio
+async def test_loader_bounds_concurrent_server_startup(monkeypatch, tmp_path: Path):
+    """Server startup should run concurrently but never exceed the configured cap."""
+    config_path = tmp_path / ".mcp.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    f"server-{index}": {"command": "uvx", "args": [str(index)]}
+                    for index in range(5)
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    active = 0
+    peak = 0
+
+    class _FakeToolset:
+        tools = []
+
+        async def close(self):
+            return None
+
+    async def _fake_create(connection_params, name, structured_output):
+        del connection_params, name, structured_output
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return _FakeToolset()
+
+    monkeypatch.setattr(mcp_loader_module, "MCP_AVAILABLE", True)
+    monkeypatch.setattr(mcp_loader_module, "DEFAULT_MCP_STARTUP_CONCURRENCY", 2)
+    monkeypatch.setattr(
+        mcp_loader_module,
+        "MCPToolset",
+        type("FakeToolsetFactory", (), {"create": staticmethod(_fake_create)}),
+    )
+
+    loader = MCPToolsLoader(config_path=config_path, auto_discover=False)
+    loader.load_config()
+    await loader.load_all_tools()
+
+    assert peak == 2
+    assert all(
+        info["status"] == "connected" for info in loader.get_server_info().values()
+    )
+
+
+@pytest.mark.asyncio
+async def test_loader_close_does_not_wait_on_hung_toolset(monkeypatch):
+    """One stuck toolset should time out without delaying the others."""
+    closed = []
+
+    class _Toolset:
+        def __init__(self, name: str, delay: float):
+            self.name = name
+            self.delay = delay
+
+        async def close(self):
+            await asyncio.sleep(self.delay)
+            closed.append(self.name)
+
+    monkeypatch.setattr(mcp_loader_module, "DEFAULT_MCP_CLOSE_TIMEOUT", 0.05)
+
+    loader = MCPToolsLoader(auto_discover=False)
+    loader.toolsets = [_Toolset("hung", 10), _Toolset("ok", 0)]
+    await asyncio.wait_for(loader.close(), timeout=1)
+
+    assert closed == ["ok"]
+    assert len(loader.toolsets) == 0
+
+
 @pytest.mark.asyncio
 async def test_cached_mcp_tool_saves_large_outputs(tmp_path: Path, monkeypatch):
     """Oversized MCP tool results should be cached instead of surfacing as raw errors."""
@@ -0,0 +1,77 @@
+"""Tests for tool output truncation helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from minion_code.utils.output_truncator import (
+    FileTooLargeError,
+    MCPContentTooLargeError,
+    _utf8_prefix,
+    check_file_size_before_read,
+    check_mcp_output,
+    truncate_output,
+)
+
+
+def test_truncate_output_passes_through_small_outputs():
+    """Outputs under the byte limit should be returned unchanged."""
+    text = "é" * 25
+    assert truncate_output(text, max_size=100, save_full=False) is text
+    assert truncate_output("x" * 100, max_size=100, save_full=False) == "x" * 100
+
+
+def test_truncate_output_limits_ascii_and_multibyte_by_bytes():
+    """Truncation should count UTF-8 bytes and never split a character."""
+    ascii_result = truncate_output("x" * 200, max_size=100, save_full=False)
+    assert ascii_result.startswith("x" * 100 + "\n\n---\n")
+
+    multibyte_result = truncate_output("中" * 100, max_size=100, save_full=False)
+    body = multibyte_result.split("\n\n---\n", 1)[0]
+    assert body == "中" * 33
+
+
+def test_utf8_prefix_backs_off_to_character_boundary():
+    """A cut inside a multi-byte character should drop the whole character."""
+    encoded = "a中😀".encode("utf-8")
+
+    assert [_utf8_prefix(encoded, size) for size in range(len(encoded) + 1)] == [
+        "",
+        "a",
+        "a",
+        "a",
+        "a中",
+        "a中",
+        "a中",
+        "a中",
+        "a中😀",
+    ]
+
+
+def test_check_file_size_before_read_suggests_tool_for_large_files(tmp_path: Path):
+    """Oversized files raise with a type-specific suggestion; others pass."""
+    report = tmp_path / "Report.PDF"
+    report.write_bytes(b"x" * 20)
+
+    check_file_size_before_read(str(tmp_path / "missing.pdf"), max_size=10)
+    check_file_size_before_read(str(report), max_size=20)
+
+    with pytest.raises(FileTooLargeError) as exc_info:
+        check_file_size_before_read(str(report), max_size=10)
+
+    assert exc_info.value.file_size == 20
+    assert exc_info.value.file_path == str(report)
+    assert exc_info.value.suggested_tool == "pdf 工具"
+
+
+def test_check_mcp_output_limit_is_exact_at_boundary():
+    """Outputs estimated at exactly max_tokens pass; one token more raises."""
+    at_limit = "x" * (10 * 4 + 3)
+    assert check_mcp_output(at_limit, max_tokens=10) is at_limit
+
+    with pytest.raises(MCPContentTooLargeError) as exc_info:
+        check_mcp_output("x" * (11 * 4), max_tokens=10)
+
+    assert exc_info.value.token_count == 11
@@ -0,0 +1,622 @@
+"""Tests for session persistence."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from minion_code.utils.session_storage import (
+    SessionMessage,
+    SessionMetadata,
+    SessionStorage,
+)
+
+
+def test_session_round_trips_messages_and_agent_history(tmp_path: Path):
+    """Saved sessions should load back with the same content."""
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+    storage.add_message(session, "user", "héllo wörld")
+    storage.add_message(session, "assistant", "hi")
+    session.agent_history = [{"role": "user", "content": "summary"}]
+    session.compaction_count = 1
+    storage.save_session(session)
+
+    loaded = storage.load_session(session.metadata.session_id)
+
+    assert [(m.role, m.content) for m in loaded.messages] == [
+        ("user", "héllo wörld"),
+        ("assistant", "hi"),
+    ]
+    assert loaded.agent_history == [{"role": "user", "content": "summary"}]
+    assert loaded.compaction_count == 1
+    assert loaded.metadata.title == "héllo wörld"
+    assert loaded.metadata.message_count == 2
+
+
+def test_list_sessions_filters_by_project_and_sorts_newest_first(tmp_path: Path):
+    """Listing should honour project filters, recency order and the limit."""
+    storage = SessionStorage(storage_dir=tmp_path)
+    for index, project in enumerate(["/a", "/b", "/a"]):
+        session = storage.create_session(project_path=project)
+        storage.add_message(session, "user", f"message {index}")
+
+    all_sessions = storage.list_sessions()
+    project_sessions = storage.list_sessions(project_path="/a")
+
+    assert [s.title for s in all_sessions] == ["message 2", "message 1", "message 0"]
+    assert [s.title for s in project_sessions] == ["message 2", "message 0"]
+    assert len(storage.list_sessions(limit=1)) == 1
+    assert storage.get_latest_session_id("/b") == all_sessions[1].session_id
+
+
+def test_load_session_reads_legacy_files(tmp_path: Path):
+    """Sessions written before agent_history existed should still load."""
+    (tmp_path / "legacy01.json").write_text(
+        json.dumps(
+            {
+                "metadata": {
+                    "session_id": "legacy01",
+                    "created_at": "2024-01-01T00:00:00",
+                    "updated_at": "2024-01-01T00:00:00",
+                    "project_path": "/old",
+                    "message_count": 1,
+                    "title": "old",
+                },
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": "old",
+                        "timestamp": "2024-01-01T00:00:00",
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    storage = SessionStorage(storage_dir=tmp_path)
+
+    loaded = storage.load_session("legacy01")
+
+    assert loaded.messages[0].content == "old"
+    assert loaded.agent_history == []
+    assert loaded.compaction_count == 0
+    assert [s.session_id for s in storage.list_sessions()] == ["legacy01"]
+    assert (tmp_path / "legacy01.meta.json").exists()
+
+
+def test_list_sessions_reads_metadata_sidecar_only(tmp_path: Path):
+    """Without the index, a fresh sidecar should be used instead of the body."""
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+    storage.add_message(session, "user", "hello")
+    storage.close()
+
+    session_path = tmp_path / f"{session.metadata.session_id}.json"
+    sidecar_mtime = (tmp_path / f"{session.metadata.session_id}.meta.json").stat()
+    session_path.write_text("not json", encoding="utf-8")
+    os.utime(
+        session_path,
+        ns=(sidecar_mtime.st_mtime_ns - 1_000, sidecar_mtime.st_mtime_ns - 1_000),
+    )
+
+    assert [s.title for s in storage.list_sessions()] == ["hello"]
+
+
+def test_session_index_tracks_saves_and_deletes_across_instances(tmp_path: Path):
+    """The SQLite index should be shared by storages on the same directory."""
+    writer = SessionStorage(storage_dir=tmp_path)
+    kept = writer.create_session(project_path="/work")
+    writer.add_message(kept, "user", "keep me")
+    dropped = writer.create_session(project_path="/work")
+    writer.add_message(dropped, "user", "drop me")
+
+    reader = SessionStorage(storage_dir=tmp_path)
+    assert reader.get_latest_session_id("/work") == dropped.metadata.session_id
+
+    assert writer.delete_session(dropped.metadata.session_id) is True
+    assert [s.session_id for s in reader.list_sessions(project_path="/work")] == [
+        kept.metadata.session_id
+    ]
+
+
+def test_add_message_appends_to_journal_without_rewriting_session(tmp_path: Path):
+    """Auto-saved messages should go to the journal and load back in order."""
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+    storage.add_message(session, "user", "first")
+    session_id = session.metadata.session_id
+    session_path = tmp_path / f"{session_id}.json"
+    base_bytes = session_path.read_bytes()
+
+    storage.add_message(session, "assistant", "second")
+    storage.add_message(session, "user", "third")
+
+    assert session_path.read_bytes() == base_bytes
+    assert (tmp_path / f"{session_id}.messages.jsonl").exists()
+    assert storage.list_sessions()[0].message_count == 3
+
+    loaded = SessionStorage(storage_dir=tmp_path).load_session(session_id)
+    assert [m.content for m in loaded.messages] == ["first", "second", "third"]
+    assert loaded.metadata.message_count == 3
+
+    storage.save_session(session)
+    assert not (tmp_path / f"{session_id}.messages.jsonl").exists()
+    assert [m.content for m in storage.load_session(session_id).messages] == [
+        "first",
+        "second",
+        "third",
+    ]
+
+
+def test_load_session_ignores_stale_and_torn_journal_lines(tmp_path: Path):
+    """Journal entries already in the main file, or half-written, are skipped."""
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+    storage.add_message(session, "user", "first")
+    storage.add_message(session, "assistant", "second")
+    session_id = session.metadata.session_id
+    journal = tmp_path / f"{session_id}.messages.jsonl"
+    journal_bytes = journal.read_bytes()
+
+    # Simulate a crash after the full save but before the journal was removed
+    storage.save_session(session)
+    journal.write_bytes(journal_bytes + b'{"seq": 2, "role": "us')
+
+    loaded = SessionStorage(storage_dir=tmp_path).load_session(session_id)
+    assert [m.content for m in loaded.messages] == ["first", "second"]
+
+
+def test_journal_handles_are_reused_and_bounded(tmp_path: Path, monkeypatch):
+    """Appends reuse one open handle per session, evicting the least recent."""
+    import minion_code.utils.session_storage as session_storage_module
+
+    monkeypatch.setattr(session_storage_module, "_MAX_JOURNAL_HANDLES", 1)
+    storage = SessionStorage(storage_dir=tmp_path)
+    first = storage.create_session(project_path="/work")
+    second = storage.create_session(project_path="/work")
+    for session in (first, second):
+        storage.add_message(session, "user", "hello")
+
+    storage.add_message(first, "assistant", "a1")
+    handle = storage._journal_handles[first.metadata.session_id]
+    storage.add_message(first, "user", "a2")
+    assert storage._journal_handles[first.metadata.session_id] is handle
+
+    storage.add_message(second, "assistant", "b1")
+    assert list(storage._journal_handles) == [second.metadata.session_id]
+    assert handle.closed
+
+    storage.add_message(first, "assistant", "a3")
+    storage.close()
+
+    reader = SessionStorage(storage_dir=tmp_path)
+    assert [m.content for m in reader.load_session(first.metadata.session_id).messages] == [
+        "hello",
+        "a1",
+        "a2",
+        "a3",
+    ]
+    assert [
+        m.content for m in reader.load_session(second.metadata.session_id).messages
+    ] == ["hello", "b1"]
+
+
+def test_load_session_reuses_parse_until_files_change(tmp_path: Path, monkeypatch):
+    """Repeated loads should hit the cache and hand out independent copies."""
+    import minion_code.utils.session_storage as session_storage_module
+
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+    storage.add_message(session, "user", "hello")
+    session_id = session.metadata.session_id
+
+    parses = []
+    original_loads = session_storage_module._loads
+
+    def counting_loads(data):
+        parses.append(data)
+        return original_loads(data)
+
+    monkeypatch.setattr(session_storage_module, "_loads", counting_loads)
+
+    first = storage.load_session(session_id)
+    first.messages.append(first.messages[0])
+    first.metadata.title = "mutated"
+    second = storage.load_session(session_id)
+
+    assert len(parses) == 1
+    assert len(second.messages) == 1
+    assert second.metadata.title == "hello"
+
+    storage.add_message(second, "assistant", "world")
+    third = storage.load_session(session_id)
+    assert [m.content for m in third.messages] == ["hello", "world"]
+
+
+def test_title_comes_from_first_user_message(tmp_path: Path):
+    """The title is set from the first user message and then left alone."""
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+
+    storage.add_message(session, "assistant", "greeting", auto_save=False)
+    assert session.metadata.title is None
+
+    storage.add_message(session, "user", "x" * 60, auto_save=False)
+    storage.add_message(session, "user", "second question", auto_save=False)
+
+    assert session.metadata.title == "x" * 50 + "..."
+
+
+def test_to_dict_matches_asdict():
+    """Hand-written serializers must cover every dataclass field."""
+    message = SessionMessage(role="user", content="hi")
+    metadata = SessionMetadata(
+        session_id="abc",
+        created_at="2024-01-01T00:00:00",
+        updated_at="2024-01-01T00:00:00",
+        project_path="/work",
+        message_count=1,
+        title="hi",
+    )
+
+    assert message.to_dict() == asdict(message)
+    assert metadata.to_dict() == asdict(metadata)
+
+
+def test_list_sessions_pages_with_keyset_cursor(tmp_path: Path):
+    """Paging with the last (updated_at, session_id) should not skip or repeat."""
+    storage = SessionStorage(storage_dir=tmp_path)
+    for index in range(5):
+        session = storage.create_session(project_path="/work")
+        storage.add_message(session, "user", f"message {index}")
+
+    for use_index in (True, False):
+        if not use_index:
+            storage.close()
+        pages = []
+        cursor = None
+        while True:
+            page = storage.list_sessions(limit=2, before=cursor)
+            if not page:
+                break
+            pages.append([s.title for s in page])
+            cursor = (page[-1].updated_at, page[-1].session_id)
+
+        assert pages == [
+            ["message 4", "message 3"],
+            ["message 2", "message 1"],
+            ["message 0"],
+        ]
+
+
+def test_scan_reads_session_files_on_thread_pool(tmp_path: Path, monkeypatch):
+    """Large legacy scans should return the same sessions as the serial path."""
+    import minion_code.utils.session_storage as session_storage_module
+
+    monkeypatch.setattr(session_storage_module, "_SCAN_PARALLEL_THRESHOLD", 2)
+    storage = SessionStorage(storage_dir=tmp_path)
+    for index in range(6):
+        session = storage.create_session(project_path=f"/p{index % 2}")
+        storage.add_message(session, "user", f"message {index}")
+    storage.close()
+    (tmp_path / "broken.json").write_text("not json", encoding="utf-8")
+
+    assert [s.title for s in storage.list_sessions(project_path="/p0")] == [
+        "message 4",
+        "message 2",
+        "message 0",
+    ]
+    assert len(storage.list_sessions()) == 6
+
+
+def test_load_agent_history_prefers_compacted_history(tmp_path: Path, monkeypatch):
+    """Only agent_history is returned when present; messages are the fallback."""
+    import minion_code.utils.session_storage as session_storage_module
+
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+    storage.add_message(session, "user", "first")
+    storage.add_message(session, "assistant", "second")
+    session_id = session.metadata.session_id
+
+    reader = SessionStorage(storage_dir=tmp_path)
+    assert reader.load_agent_history(session_id) == (
+        [
+            {"role": "user", "content": "first"},
+            {"role": "assistant", "content": "second"},
+        ],
+        0,
+    )
+
+    session.agent_history = [{"role": "user", "content": "summary"}]
+    session.compaction_count = 2
+    storage.save_session(session)
+
+    monkeypatch.setattr(
+        session_storage_module,
+        "SessionMessage",
+        lambda **kwargs: (_ for _ in ()).throw(AssertionError("messages parsed")),
+    )
+    assert reader.load_agent_history(session_id) == (
+        [{"role": "user", "content": "summary"}],
+        2,
+    )
+    assert reader.load_agent_history("missing") is None
+
+
+def test_restore_agent_history_accepts_session_or_id(tmp_path: Path, monkeypatch):
+    """Restoring by ID should match restoring from a loaded session."""
+    from types import SimpleNamespace
+
+    import minion_code.utils.session_storage as session_storage_module
+
+    storage = SessionStorage(storage_dir=tmp_path)
+    monkeypatch.setattr(session_storage_module, "_storage", storage)
+    session = storage.create_session(project_path="/work")
+    storage.add_message(session, "user", "hello")
+
+    by_session = SimpleNamespace(state=SimpleNamespace(history=["stale"]))
+    by_id = SimpleNamespace(state=SimpleNamespace(history=[]))
+
+    assert session_storage_module.restore_agent_history(by_session, session) == 1
+    assert (
+        session_storage_module.restore_agent_history(
+            by_id, session.metadata.session_id
+        )
+        == 1
+    )
+    assert by_session.state.history == by_id.state.history == [
+        {"role": "user", "content": "hello"}
+    ]
+
+
+def test_generated_session_ids_sort_by_creation_time(tmp_path: Path):
+    """New IDs are unique, fixed-width hex and ordered by creation."""
+    storage = SessionStorage(storage_dir=tmp_path)
+
+    ids = [storage.generate_session_id() for _ in range(50)]
+
+    assert len(set(ids)) == len(ids)
+    assert all(len(session_id) == 24 for session_id in ids)
+    assert [session_id[:16] for session_id in ids] == sorted(
+        session_id[:16] for session_id in ids
+    )
+
+
+def test_global_session_storage_is_created_lazily(tmp_path: Path):
+    """Importing the module should not create the storage directory."""
+    import subprocess
+    import sys
+
+    code = (
+        "import minion_code.utils.session_storage as m\n"
+        "from pathlib import Path\n"
+        "sessions = Path.home() / '.minion-code' / 'sessions'\n"
+        "assert m._storage is None and not sessions.exists()\n"
+        "assert m.session_storage is m._get_storage()\n"
+        "assert sessions.is_dir()\n"
+    )
+    env = {**os.environ, "HOME": str(tmp_path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+def test_save_session_keeps_previous_file_when_write_fails(tmp_path: Path, monkeypatch):
+    """A failed save should leave the last good session file and no temp file."""
+    import minion_code.utils.session_storage as session_storage_module
+
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+    storage.add_message(session, "user", "kept")
+    session_path = tmp_path / f"{session.metadata.session_id}.json"
+    good_bytes = session_path.read_bytes()
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(session_storage_module.os, "replace", failing_replace)
+    session.messages[0].content = "lost"
+    with pytest.raises(OSError):
+        storage.save_session(session)
+
+    assert session_path.read_bytes() == good_bytes
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_save_session_skips_unchanged_content(tmp_path: Path, monkeypatch):
+    """Saving identical content again should not rewrite the session file."""
+    import minion_code.utils.session_storage as session_storage_module
+
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+    storage.add_message(session, "user", "hello", auto_save=False)
+    storage.save_session(session)
+    session_path = tmp_path / f"{session.metadata.session_id}.json"
+
+    writes = []
+    original_write = session_storage_module._write_atomic
+    monkeypatch.setattr(
+        session_storage_module,
+        "_write_atomic",
+        lambda path, payload: writes.append(path) or original_write(path, payload),
+    )
+
+    storage.save_session(session)
+    assert writes == []
+
+    session.compaction_count = 1
+    storage.save_session(session)
+    assert writes[0] == session_path
+
+    # A file changed behind our back is rewritten even if content matches
+    session_path.write_text("{}", encoding="utf-8")
+    writes.clear()
+    storage.save_session(session)
+    assert writes[0] == session_path
+    assert storage.load_session(session.metadata.session_id).compaction_count == 1
+
+
+def test_now_iso_matches_datetime_isoformat(monkeypatch):
+    """Cached timestamps should format exactly like datetime.isoformat()."""
+    from datetime import datetime
+
+    import minion_code.utils.session_storage as session_storage_module
+
+    base = int(datetime(2024, 5, 6, 7, 8, 9).timestamp())
+    for offset_ns in (0, 123_456_000, 999_999_999, 1_000_000_000):
+        now_ns = base * 1_000_000_000 + offset_ns
+        monkeypatch.setattr(session_storage_module.time, "time_ns", lambda: now_ns)
+        expected = datetime.fromtimestamp(
+            now_ns // 1_000_000_000
+        ).replace(microsecond=(now_ns // 1000) % 1_000_000)
+        assert session_storage_module._now_iso() == expected.isoformat()
+
+
+def test_journal_appends_skip_the_sidecar_while_indexed(tmp_path: Path):
+    """Appends touch only the journal and index; a later scan still sees them."""
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+    storage.add_message(session, "user", "first")
+    session_id = session.metadata.session_id
+    sidecar = tmp_path / f"{session_id}.meta.json"
+    sidecar_bytes = sidecar.read_bytes()
+
+    storage.add_message(session, "assistant", "second")
+    storage.add_message(session, "user", "third")
+
+    assert sidecar.read_bytes() == sidecar_bytes
+    assert storage.list_sessions()[0].message_count == 3
+
+    # Without the index the journal makes the sidecar stale, so the scan
+    # folds the journal into the listed metadata
+    storage.close()
+    journal = tmp_path / f"{session_id}.messages.jsonl"
+    mtime = sidecar.stat().st_mtime_ns + 1_000
+    os.utime(journal, ns=(mtime, mtime))
+    listed = storage.list_sessions()
+    assert [(s.session_id, s.message_count) for s in listed] == [(session_id, 3)]
+    assert listed[0].updated_at == session.messages[-1].timestamp
+
+
+def test_index_reconciles_with_files_added_or_removed_outside(tmp_path: Path):
+    """Files copied in or deleted behind the index's back are picked up."""
+    storage = SessionStorage(storage_dir=tmp_path)
+    older = storage.create_session(project_path="/work")
+    storage.add_message(older, "user", "older")
+    removed = storage.create_session(project_path="/work")
+    storage.add_message(removed, "user", "removed")
+    storage.close()
+
+    # A newer session written by a version without the index
+    (tmp_path / "copied01.json").write_text(
+        json.dumps(
+            {
+                "metadata": {
+                    "session_id": "copied01",
+                    "created_at": "2999-01-01T00:00:00",
+                    "updated_at": "2999-01-01T00:00:00",
+                    "project_path": "/work",
+                    "message_count": 0,
+                    "title": "copied",
+                },
+                "messages": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+    (tmp_path / f"{removed.metadata.session_id}.json").unlink()
+
+    reopened = SessionStorage(storage_dir=tmp_path)
+    assert [s.session_id for s in reopened.list_sessions()] == [
+        "copied01",
+        older.metadata.session_id,
+    ]
+
+    # Deleted while the index is open: skipped and dropped on the next listing
+    (tmp_path / "copied01.json").unlink()
+    assert reopened.get_latest_session_id("/work") == older.metadata.session_id
+    assert [s.session_id for s in reopened.list_sessions()] == [
+        older.metadata.session_id
+    ]
+
+
+def test_auto_save_journals_messages_added_without_saving(tmp_path: Path):
+    """Messages added with auto_save=False are journaled by the next auto-save."""
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+    storage.add_message(session, "user", "m0")
+    storage.add_message(session, "assistant", "m1", auto_save=False)
+    storage.add_message(session, "user", "m2")
+    storage.add_message(session, "assistant", "m3")
+
+    session_id = session.metadata.session_id
+    loaded = SessionStorage(storage_dir=tmp_path).load_session(session_id)
+    assert [m.content for m in loaded.messages] == ["m0", "m1", "m2", "m3"]
+
+    # Continuing a reloaded session keeps appending after what is stored
+    reader = SessionStorage(storage_dir=tmp_path)
+    resumed = reader.load_session(session_id)
+    reader.add_message(resumed, "user", "m4", auto_save=False)
+    reader.add_message(resumed, "assistant", "m5")
+    assert [
+        m.content for m in SessionStorage(storage_dir=tmp_path).load_session(
+            session_id
+        ).messages
+    ] == ["m0", "m1", "m2", "m3", "m4", "m5"]
+
+
+def test_load_agent_history_from_cache_returns_copies(tmp_path: Path):
+    """Mutating restored history must not change the cached session."""
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+    storage.add_message(session, "user", "first")
+    session.agent_history = [{"role": "user", "content": "summary"}]
+    storage.save_session(session)
+    session_id = session.metadata.session_id
+
+    storage.load_session(session_id)
+    history, _ = storage.load_agent_history(session_id)
+    history[0]["content"] = "mutated"
+
+    assert storage.load_session(session_id).agent_history == [
+        {"role": "user", "content": "summary"}
+    ]
+    assert storage.load_agent_history(session_id)[0] == [
+        {"role": "user", "content": "summary"}
+    ]
+
+
+def test_title_is_set_on_save_and_journal_replay(tmp_path: Path):
+    """Sessions titled by neither add_message path still get a title."""
+    storage = SessionStorage(storage_dir=tmp_path)
+    session = storage.create_session(project_path="/work")
+    session.messages = [
+        SessionMessage(role="assistant", content="welcome"),
+        SessionMessage(role="user", content="built by hand"),
+    ]
+    storage.save_session(session)
+
+    assert session.metadata.title == "built by hand"
+    assert storage.list_sessions()[0].title == "built by hand"
+
+    # A session saved before its first user message, which then only
+    # reached the journal
+    untitled = storage.create_session(project_path="/work")
+    storage.add_message(untitled, "assistant", "hello")
+    journal = tmp_path / f"{untitled.metadata.session_id}.messages.jsonl"
+    journal.write_text(
+        json.dumps(
+            {"seq": 1, "role": "user", "content": "from journal", "timestamp": "t"}
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    loaded = SessionStorage(storage_dir=tmp_path).load_session(
+        untitled.metadata.session_id
+    )
+    assert loaded.metadata.title == "from journal"
@@ -0,0 +1,210 @@
+"""Tests for todo persistence."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from minion_code.utils.todo_storage import (
+    TodoItem,
+    TodoPriority,
+    TodoStatus,
+    TodoStorage,
+)
+
+
+def _todo(todo_id: str, content: str = "task") -> TodoItem:
+    return TodoItem(
+        id=todo_id,
+        content=content,
+        status=TodoStatus.PENDING,
+        priority=TodoPriority.MEDIUM,
+    )
+
+
+def test_todos_round_trip_and_reuse_parse(tmp_path: Path, monkeypatch):
+    """Todos should only be re-read from disk when the file changes."""
+    import minion_code.utils.todo_storage as todo_storage_module
+
+    storage = TodoStorage(storage_dir=str(tmp_path))
+    storage.set_todos([_todo("1", "héllo"), _todo("2")], "agent")
+    storage.flush_sync()
+
+    reader = TodoStorage(storage_dir=str(tmp_path))
+    parses = []
+    original_from_dict = todo_storage_module.TodoItem.from_dict
+    monkeypatch.setattr(
+        todo_storage_module.TodoItem,
+        "from_dict",
+        lambda data: parses.append(data) or original_from_dict(data),
+    )
+
+    first = reader.get_todos("agent")
+    first[0].content = "mutated"
+    second = reader.get_todos("agent")
+
+    assert [t.content for t in second] == ["héllo", "task"]
+    assert len(parses) == 2
+
+    storage.add_todo(_todo("3"), "agent")
+    storage.flush_sync()
+    assert [t.id for t in reader.get_todos("agent")] == ["1", "2", "3"]
+
+
+def test_update_todos_bulk_writes_once(tmp_path: Path, monkeypatch):
+    """A batch of updates should be applied in one pass and one write."""
+    storage = TodoStorage(storage_dir=str(tmp_path))
+    storage.set_todos([_todo("1"), _todo("2"), _todo("3")])
+    storage.flush_sync()
+
+    writes = []
+    original_write = storage._write
+    monkeypatch.setattr(
+        storage,
+        "_write",
+        lambda agent_id, todos: writes.append(agent_id)
+        or original_write(agent_id, todos),
+    )
+
+    updated = storage.update_todos_bulk(
+        {"1": {"status": "completed"}, "3": {"content": "done"}, "9": {}}
+    )
+    storage.flush_sync()
+
+    assert updated == 2
+    assert len(writes) == 1
+    on_disk = json.loads((tmp_path / "todos_default.json").read_text())
+    assert [(t["status"], t["content"]) for t in on_disk] == [
+        ("completed", "task"),
+        ("pending", "task"),
+        ("pending", "done"),
+    ]
+    assert storage.update_todo("2", {"priority": "high"}) is True
+    assert storage.remove_todo("2") is True
+    assert storage.remove_todo("2") is False
+    storage.flush_sync()
+    assert [t.id for t in TodoStorage(storage_dir=str(tmp_path)).get_todos()] == [
+        "1",
+        "3",
+    ]
+
+
+def test_id_index_follows_add_remove_and_set(tmp_path: Path):
+    """Lookups by id should see adds, removes and wholesale replacement."""
+    storage = TodoStorage(storage_dir=str(tmp_path))
+    storage.set_todos([_todo("a", "first"), _todo("a", "duplicate")])
+
+    assert storage.update_todo("a", {"content": "updated"}) is True
+    assert [t.content for t in storage.get_todos()] == ["updated", "duplicate"]
+
+    storage.add_todo(_todo("b"))
+    assert storage.update_todo("b", {"status": "in_progress"}) is True
+    assert storage.remove_todo("a") is True
+    assert storage.update_todo("a", {"content": "gone"}) is False
+
+    storage.set_todos([_todo("c")])
+    assert storage.update_todo("b", {"content": "stale"}) is False
+    assert [t.id for t in storage.get_todos()] == ["c"]
+
+
+def test_todo_file_name_helpers(tmp_path: Path):
+    """Todo file names map to agent ids, with "default" meaning no agent."""
+    from minion_code.utils.todo_file_utils import (
+        extract_agent_id_from_todo_file,
+        is_todo_file,
+        list_todo_files,
+    )
+
+    for name in ("todos_default.json", "todos_agent-1.json", "todo.json", "x.json"):
+        (tmp_path / name).write_text("[]", encoding="utf-8")
+
+    assert sorted(os.path.basename(p) for p in list_todo_files(str(tmp_path))) == [
+        "todos_agent-1.json",
+        "todos_default.json",
+    ]
+    assert list_todo_files(str(tmp_path / "missing")) == []
+    assert extract_agent_id_from_todo_file("/x/todos_agent-1.json") == "agent-1"
+    assert extract_agent_id_from_todo_file("/x/todos_default.json") is None
+    assert extract_agent_id_from_todo_file("/x/notes.json") is None
+    assert is_todo_file("todos_.json") is True
+    assert is_todo_file("/x/todos_a.json.bak") is False
+
+
+def test_rapid_updates_are_coalesced_into_one_write(tmp_path: Path, monkeypatch):
+    """Bursts of changes are written once, by the timer or by flush_sync."""
+    import time
+
+    storage = TodoStorage(storage_dir=str(tmp_path), flush_delay=0.05)
+    writes = []
+    original_write = storage._write
+    monkeypatch.setattr(
+        storage,
+        "_write",
+        lambda agent_id, todos: writes.append(agent_id)
+        or original_write(agent_id, todos),
+    )
+
+    storage.set_todos([_todo("1")])
+    storage.update_todo("1", {"status": "in_progress"})
+    storage.update_todo("1", {"status": "completed"})
+    assert writes == []
+    assert storage.get_todos()[0].status is TodoStatus.COMPLETED
+
+    deadline = time.monotonic() + 5
+    while not writes and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert writes == [None]
+
+    storage.add_todo(_todo("2"))
+    storage.flush_sync()
+    assert writes == [None, None]
+    assert [t.id for t in TodoStorage(storage_dir=str(tmp_path)).get_todos()] == [
+        "1",
+        "2",
+    ]
+
+    with pytest.raises(ValueError):
+        storage.update_todos_bulk({"1": {"content": "x"}, "2": {"status": "bogus"}})
+    assert storage.get_todos()[0].content == "task"
+
+
+def test_failed_scheduled_write_is_discarded_and_reported(
+    tmp_path: Path, monkeypatch
+):
+    """A write failing on the timer thread is raised by the next call."""
+    import threading
+    import time
+
+    thread_errors = []
+    monkeypatch.setattr(threading, "excepthook", thread_errors.append)
+    storage = TodoStorage(storage_dir=str(tmp_path), flush_delay=0.01)
+    storage.set_todos([_todo("1")])
+    storage.flush_sync()
+    # A directory where the temp file goes makes every write fail
+    blocker = tmp_path / "todos_default.json.tmp"
+    blocker.mkdir()
+
+    storage.set_todos([_todo("2")])
+    deadline = time.monotonic() + 2
+    while storage._flush_timer is not None or storage._dirty:
+        assert time.monotonic() < deadline, "scheduled flush never ran"
+        time.sleep(0.01)
+
+    assert thread_errors == []
+    with pytest.raises(OSError):
+        storage.get_todos()
+    # The unsaved change is gone; reads come from disk again
+    assert [t.id for t in storage.get_todos()] == ["1"]
+
+    storage.set_todos([_todo("3")])
+    with pytest.raises(OSError):
+        storage.flush()
+    assert [t.id for t in storage.get_todos()] == ["1"]
+
+    blocker.rmdir()
+    storage.set_todos([_todo("4")])
+    storage.flush()
+    assert json.loads((tmp_path / "todos_default.json").read_text())[0]["id"] == "4"
@@ -0,0 +1,312 @@
+"""Tests for the web chat SSE stream."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from minion_code.web.adapters.web_adapter import SSEEvent, WebOutputAdapter
+from minion_code.web.api import chat
+
+
+class FakeAgent:
+    def __init__(self, chunks, started=None, release=None):
+        self.chunks = chunks
+        self.started = started
+        self.release = release
+
+    async def run_async(self, message, stream=True):
+        for chunk in self.chunks:
+            yield chunk
+        if self.started is not None:
+            self.started.set()
+            try:
+                await self.release.wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+
+    cancelled = False
+
+
+class FakeSessionManager:
+    def __init__(self, session, agent):
+        self.session = session
+        self.agent = agent
+        self.saved = []
+
+    async def get_session(self, session_id):
+        return self.session
+
+    async def get_or_create_agent(self, session):
+        return self.agent
+
+    def save_message(self, session, role, content):
+        self.saved.append((role, content))
+
+
+def _make_session():
+    return SimpleNamespace(
+        history_mode="full",
+        generate_task_id=lambda: "task_1",
+        runtime_state=SimpleNamespace(
+            is_processing=False, processing_lock=asyncio.Lock()
+        ),
+        current_task_id=None,
+        adapter=WebOutputAdapter(session_id="s1"),
+        abort_event=asyncio.Event(),
+    )
+
+
+def _chunk(chunk_type, content):
+    return SimpleNamespace(chunk_type=chunk_type, content=content, metadata={})
+
+
+def _parse(frames):
+    events = []
+    for chunk in frames:
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode("utf-8")
+        # One write may carry several frames
+        for frame in chunk.split("\n\n")[:-1]:
+            payload = frame[len("data: ") :]
+            events.append(payload if payload == "[DONE]" else json.loads(payload))
+    return events
+
+
+async def _collect(stream):
+    return [frame async for frame in stream]
+
+
+async def test_chat_stream_forwards_events_in_order(monkeypatch):
+    """Agent output should reach the client in order, followed by completion."""
+    session = _make_session()
+    agent = FakeAgent(
+        [
+            _chunk("thinking", "hmm"),
+            _chunk("text", "Hello"),
+            _chunk("final_answer", "Hello world"),
+        ]
+    )
+    manager = FakeSessionManager(session, agent)
+    monkeypatch.setattr(chat, "session_manager", manager)
+
+    events = _parse(await _collect(chat.process_chat_stream("s1", "hi")))
+
+    # Adjacent chunks may arrive batched into one event; the text is the same
+    streamed = []
+    for e in events[:-1]:
+        if e["type"] == "task_status":
+            continue
+        if streamed and streamed[-1][0] == e["type"]:
+            streamed[-1] = (e["type"], streamed[-1][1] + e["chunk"])
+        else:
+            streamed.append((e["type"], e.get("chunk")))
+    assert streamed == [("thinking", "hmm"), ("content", "HelloHello world")]
+    statuses = [e["state"] for e in events[:-1] if e["type"] == "task_status"]
+    assert statuses[-1] == "completed"
+    assert events[-1] == "[DONE]"
+    assert manager.saved == [("user", "hi"), ("assistant", "Hello world")]
+
+
+async def test_chat_stream_stops_promptly_on_abort(monkeypatch):
+    """Aborting mid-turn should cancel the agent without waiting for output."""
+    session = _make_session()
+    started = asyncio.Event()
+    agent = FakeAgent([_chunk("text", "partial")], started, asyncio.Event())
+    monkeypatch.setattr(chat, "session_manager", FakeSessionManager(session, agent))
+
+    async def abort_when_started():
+        await started.wait()
+        # Mirror SessionManager.abort_task, which swaps in a fresh Event
+        event = session.abort_event
+        session.abort_event = asyncio.Event()
+        event.set()
+
+    aborter = asyncio.create_task(abort_when_started())
+    stream = asyncio.create_task(_collect(chat.process_chat_stream("s1", "hi")))
+    done, _ = await asyncio.wait({stream}, timeout=2)
+    if not done:
+        stream.cancel()
+        pytest.fail("stream did not stop after abort")
+    await aborter
+
+    events = _parse(stream.result())
+    assert ("content", "partial") in [(e["type"], e.get("chunk")) for e in events[:-1]]
+    assert events[-2]["state"] == "cancelled"
+    assert events[-1] == "[DONE]"
+
+
+async def test_drain_batch_merges_adjacent_chunks_only():
+    """Queued chunks of one type and task merge; other events keep their place."""
+    queue = asyncio.Queue()
+    for event in [
+        SSEEvent(type="content", data={"chunk": "b"}, task_id="t"),
+        SSEEvent(type="content", data={"chunk": "c"}, task_id="t"),
+        SSEEvent(type="tool_call", data={"name": "x", "args": {}}, task_id="t"),
+        SSEEvent(type="thinking", data={"chunk": "d"}, task_id="t"),
+        SSEEvent(type="content", data={"chunk": "e"}, task_id="t"),
+        SSEEvent(type="content", data={"chunk": "f"}, task_id="other"),
+    ]:
+        queue.put_nowait(event)
+    first = SSEEvent(type="content", data={"chunk": "a"}, task_id="t")
+
+    batch = chat._drain_batch(first, queue)
+
+    assert [(e.type, e.data.get("chunk"), e.task_id) for e in batch] == [
+        ("content", "abc", "t"),
+        ("tool_call", None, "t"),
+        ("thinking", "d", "t"),
+        ("content", "e", "t"),
+        ("content", "f", "other"),
+    ]
+    assert batch[0].timestamp == first.timestamp
+    assert queue.empty()
+
+
+async def test_drain_batch_is_bounded(monkeypatch):
+    """A long backlog is split across wakeups without losing events."""
+    monkeypatch.setattr(chat, "_MAX_BATCH_EVENTS", 2)
+    queue = asyncio.Queue()
+    for name in "bcd":
+        queue.put_nowait(SSEEvent(type="tool_call", data={"name": name}))
+
+    batch = chat._drain_batch(SSEEvent(type="tool_call", data={"name": "a"}), queue)
+
+    assert [e.data["name"] for e in batch] == ["a", "b"]
+    assert [queue.get_nowait().data["name"] for _ in range(2)] == ["c", "d"]
+
+
+async def test_full_event_queue_applies_backpressure():
+    """A client that stops reading should trip the slow-client callback."""
+    slow = []
+    adapter = WebOutputAdapter(
+        session_id="s1",
+        max_queue_size=2,
+        put_timeout=0.01,
+        on_slow_client=lambda: slow.append(True),
+    )
+
+    await adapter.emit_content("a")
+    await adapter.emit_content("b")
+    await adapter.emit_content("c")
+    await adapter.emit_content("d")
+    adapter.text("sync")
+
+    assert adapter.event_queue.qsize() == 2
+    assert slow == [True]
+    assert adapter.dropped_events == 3
+
+    adapter.set_task_id("next")
+    adapter.event_queue.get_nowait()
+    await adapter.emit_content("e")
+    assert adapter.event_queue.qsize() == 2
+
+
+async def test_sync_emits_are_not_dropped_by_the_queue_bound():
+    """A burst of sync output past the bound is kept, in order."""
+    adapter = WebOutputAdapter(session_id="s1", max_queue_size=10, put_timeout=1)
+
+    for index in range(25):
+        adapter.text(str(index))
+
+    assert adapter.dropped_events == 0
+    assert adapter.event_queue.qsize() == 25
+
+    # Async producers still wait for the backlog to drain below the bound
+    emit = asyncio.ensure_future(adapter.emit_content("after"))
+    await asyncio.sleep(0)
+    assert not emit.done()
+    contents = [adapter.event_queue.get_nowait().data["content"] for _ in range(16)]
+    await asyncio.wait_for(emit, 1)
+
+    assert contents == [str(index) for index in range(16)]
+    remaining = [adapter.event_queue.get_nowait() for _ in range(10)]
+    assert [e.data.get("content") for e in remaining[:-1]] == [
+        str(index) for index in range(16, 25)
+    ]
+    assert remaining[-1].data["chunk"] == "after"
+    assert adapter.dropped_events == 0
+
+
+async def test_agent_is_cancelled_when_stream_consumer_goes_away(monkeypatch):
+    """Cancelling the stream (client disconnect) must also stop the agent."""
+    session = _make_session()
+    started = asyncio.Event()
+    agent = FakeAgent([], started, asyncio.Event())
+    monkeypatch.setattr(chat, "session_manager", FakeSessionManager(session, agent))
+
+    stream = asyncio.create_task(_collect(chat.process_chat_stream("s1", "hi")))
+    await started.wait()
+    stream.cancel()
+    await asyncio.wait({stream}, timeout=2)
+    # Let the cancelled agent task unwind
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert agent.cancelled is True
+
+
+def test_format_sse_event_matches_to_dict():
+    """Frames are UTF-8 bytes carrying exactly SSEEvent.to_dict()."""
+    event = SSEEvent(
+        type="content", data={"chunk": "héllo"}, task_id="t1", timestamp=12.5
+    )
+
+    frame = chat.format_sse_event(event)
+
+    assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+    assert "héllo".encode("utf-8") in frame
+    assert json.loads(frame[len(b"data: ") :]) == event.to_dict()
+    assert chat.format_sse_done() == b"data: [DONE]\n\n"
+
+
+def test_batch_is_stamped_with_one_clock_read(monkeypatch):
+    """Unstamped events get the write time; explicit timestamps are kept."""
+    reads = []
+    monkeypatch.setattr(chat.time, "time", lambda: reads.append(1) or 100.0)
+    batch = [
+        SSEEvent(type="tool_call", data={"name": "a"}),
+        SSEEvent(type="tool_call", data={"name": "b"}),
+        SSEEvent(type="tool_call", data={"name": "c"}, timestamp=5.0),
+    ]
+
+    events = _parse([chat._format_batch(batch)])
+
+    assert [e["timestamp"] for e in events] == [100.0, 100.0, 5.0]
+    assert len(reads) == 1
+
+
+async def test_sync_emit_from_worker_thread_is_queued_on_the_loop():
+    """Output from a tool running in a thread should still wake the stream."""
+    adapter = WebOutputAdapter(session_id="s1")
+    getter = asyncio.ensure_future(adapter.event_queue.get())
+    await asyncio.sleep(0)
+
+    await asyncio.to_thread(adapter.text, "from thread")
+    event = await asyncio.wait_for(getter, timeout=2)
+
+    assert (event.type, event.data["content"]) == ("text", "from thread")
+
+
+async def test_interaction_resolves_and_times_out_with_default():
+    """Answered prompts return the answer; unanswered ones fall back in time."""
+    adapter = WebOutputAdapter(session_id="s1", timeout_seconds=60)
+
+    pending = asyncio.ensure_future(adapter.choice("Pick", ["a", "b"]))
+    await asyncio.sleep(0)
+    (interaction_id,) = adapter._pending_interactions
+    timer = adapter._pending_interactions[interaction_id].timer_handle
+
+    assert adapter.resolve_interaction(interaction_id, 1) is True
+    assert await pending == 1
+    assert timer.cancelled()
+    assert not adapter.has_pending_interactions()
+
+    adapter.timeout_seconds = 0.01
+    assert await asyncio.wait_for(adapter.confirm("Go?", default=True), 2) is True
+    assert await asyncio.wait_for(adapter.form("Details", []), 2) is None
+    assert not adapter.has_pending_interactions()